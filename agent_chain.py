@@ -17,9 +17,9 @@ from prompt_pattern_registry import get_pattern_by_name, get_fallback_pattern
 from input_transformer import transform_output_to_input
 
 FUSION_TODO_DIR = Path("_fusion_todo")
-FALLBACK_LOG_PATH = FUSION_TODO_DIR / "fallback_log.json"
+FALLBACK_LOG_PATH = FUSION_TODO_DIR / "fallback_log.jsonl"
 
-@dataclass
+@dataclass(slots=True)
 class ChainConfig:
     """Chain configuration"""
     execution_mode: str
@@ -28,11 +28,14 @@ class ChainConfig:
     max_iterations: int = 3
 
 class AgentChain:
-    def __init__(self, config_path: str):
-        """Initialize chain from config file"""
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
-            
+    def __init__(self, config_path: Optional[str] = None, config: Optional[Dict] = None):
+        """Initialize chain from a config file or an in-memory config dict"""
+        if config is None:
+            with open(config_path, 'r') as f:
+                config_data = json.load(f)
+        else:
+            config_data = config
+
         self.config = ChainConfig(
             execution_mode=config_data.get("execution_mode", "simulate"),
             chain=config_data.get("chain", []),
@@ -45,20 +48,21 @@ class AgentChain:
         self.chain_output = ""
         self.reasoning_trail = []
         self.fallback_log = self._load_fallback_log()
-        
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "AgentChain":
+        """Create a chain directly from an in-memory config dict"""
+        return cls(config=config)
+
     def _load_fallback_log(self) -> Dict:
         """Load or initialize fallback log"""
         os.makedirs(FUSION_TODO_DIR, exist_ok=True)
-        if FALLBACK_LOG_PATH.exists():
+        try:
             with open(FALLBACK_LOG_PATH, 'r') as f:
-                return json.load(f)
-        return {"fallbacks": []}
-        
-    def _save_fallback_log(self):
-        """Save fallback log"""
-        with open(FALLBACK_LOG_PATH, 'w') as f:
-            json.dump(self.fallback_log, f, indent=2)
-            
+                return {"fallbacks": [json.loads(line) for line in f if line.strip()]}
+        except FileNotFoundError:
+            return {"fallbacks": []}
+
     def _log_fallback(
         self,
         agent: str,
@@ -68,7 +72,7 @@ class AgentChain:
         reason: str
     ):
         """Log a fallback event"""
-        self.fallback_log["fallbacks"].append({
+        event = {
             "timestamp": datetime.now().isoformat(),
             "agent": agent,
             "original_pattern": original_pattern,
@@ -77,8 +81,11 @@ class AgentChain:
             "reason": reason,
             "mode": self.config.execution_mode,
             "threshold": self.mode_config.critique_threshold
-        })
-        self._save_fallback_log()
+        }
+        self.fallback_log["fallbacks"].append(event)
+        # Append one JSONL line: O(1) per event instead of rewriting history
+        with open(FALLBACK_LOG_PATH, 'a') as f:
+            f.write(json.dumps(event) + "\n")
         
     def execute(self, input_text: str, adaptive: bool = True) -> Dict:
         """Execute the chain"""
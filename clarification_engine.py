@@ -3,21 +3,125 @@ ClarificationEngine - Design-Focused Clarity and Strategic Innovation
 Forces clarity through strategic questioning before complex creative processing.
 """
 
-import json
-import time
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
-from datetime import datetime
-import re
 
 from fusion_agents import BaseAgent
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Innovation framework questions are input-independent, so they are built once
+# at module load instead of on every execute() call.
+_INNOVATION_QUESTIONS = (
+    {
+        "framework": "jobs_to_be_done",
+        "question": "What job is the user truly hiring this design to accomplish? What's the deeper need?",
+        "thinking_mode": "user_motivation",
+        "breakthrough_potential": "high"
+    },
+    {
+        "framework": "first_principles",
+        "question": "If we started from scratch with no assumptions, how would we solve this?",
+        "thinking_mode": "fundamental_truths",
+        "breakthrough_potential": "high"
+    },
+    {
+        "framework": "constraint_removal",
+        "question": "What would we design if technical limitations, budget, or time didn't exist?",
+        "thinking_mode": "possibility_expansion",
+        "breakthrough_potential": "medium"
+    },
+    {
+        "framework": "future_back_thinking",
+        "question": "How will users interact with this in 10 years? What would feel magical then?",
+        "thinking_mode": "future_vision",
+        "breakthrough_potential": "high"
+    },
+    {
+        "framework": "cross_pollination",
+        "question": "How do completely different industries handle similar challenges?",
+        "thinking_mode": "pattern_transfer",
+        "breakthrough_potential": "medium"
+    }
+)
+
 
 class ClarificationEngine(BaseAgent):
     """
     Forces clarity through strategic questioning focused on design craft and innovation.
     Optimized for creative work, strategic thinking, and breakthrough ideas.
     """
-    
+
+    # No per-instance attributes beyond what BaseAgent manages; the static
+    # tables below are shared class-level (and read-only) so many engine
+    # instances cost ~nothing beyond the base agent state.
+    __slots__ = ()
+
+    design_domains = MappingProxyType({
+        "ui_ux": "User interface and user experience design",
+        "product_strategy": "Product vision and strategic direction",
+        "brand_identity": "Brand expression and visual identity",
+        "service_design": "Service experience and touchpoint design",
+        "innovation_strategy": "Breakthrough thinking and strategic innovation",
+        "design_systems": "Systematic design approach and scalability"
+    })
+
+    innovation_frameworks = MappingProxyType({
+        "jobs_to_be_done": "What job is the user hiring this design to do?",
+        "first_principles": "What are the fundamental truths we're building from?",
+        "constraint_removal": "What if this limitation didn't exist?",
+        "future_back_thinking": "What would this look like in 10 years?",
+        "cross_pollination": "How do other industries solve similar problems?"
+    })
+
+    # Ambiguity indicators per category: (per-hit clarity weight, indicator phrases)
+    ambiguity_indicators = MappingProxyType({
+        "outcome_clarity": (0.3, (
+            "will result in", "so that", "in order to", "the goal is",
+            "users will be able to", "success looks like", "the outcome"
+        )),
+        "audience_definition": (0.25, (
+            "users", "customers", "for people who", "target audience",
+            "persona", "user type", "demographic", "segment"
+        )),
+        "constraint_definition": (0.2, (
+            "constraint", "limitation", "requirement", "must", "cannot",
+            "within", "budget", "timeline", "technical", "platform"
+        )),
+        "success_criteria": (0.25, (
+            "success", "measure", "metric", "kpi", "goal", "target",
+            "achieve", "improve", "increase", "reduce", "optimize"
+        )),
+        "innovation_scope": (0.3, (
+            "innovative", "breakthrough", "revolutionary", "reimagine",
+            "disrupt", "transform", "novel", "creative", "original"
+        ))
+    })
+
+    domain_indicators = MappingProxyType({
+        "ui_ux": ("interface", "experience", "usability", "interaction"),
+        "product_strategy": ("strategy", "vision", "roadmap", "market"),
+        "brand_identity": ("brand", "identity", "voice", "personality"),
+        "service_design": ("service", "touchpoint", "journey", "experience"),
+        "innovation_strategy": ("innovation", "disruption", "opportunity", "future"),
+        "design_systems": ("system", "scalable", "consistent", "components")
+    })
+
+    # Pre-encoded byte forms so the assessor can scan with bytes.find (C memmem)
+    # instead of unicode-aware `in` checks on every call
+    _indicator_bytes = {
+        category: tuple(indicator.encode("ascii") for indicator in indicators)
+        for category, (_weight, indicators) in ambiguity_indicators.items()
+    }
+    _domain_indicator_bytes = {
+        domain: tuple(indicator.encode("ascii") for indicator in indicators)
+        for domain, indicators in domain_indicators.items()
+    }
+
     def __init__(self):
         super().__init__(
             agent_id="ClarificationEngine",
@@ -41,23 +145,6 @@ class ClarificationEngine(BaseAgent):
             }
         )
         
-        self.design_domains = {
-            "ui_ux": "User interface and user experience design",
-            "product_strategy": "Product vision and strategic direction",
-            "brand_identity": "Brand expression and visual identity",
-            "service_design": "Service experience and touchpoint design",
-            "innovation_strategy": "Breakthrough thinking and strategic innovation",
-            "design_systems": "Systematic design approach and scalability"
-        }
-        
-        self.innovation_frameworks = {
-            "jobs_to_be_done": "What job is the user hiring this design to do?",
-            "first_principles": "What are the fundamental truths we're building from?",
-            "constraint_removal": "What if this limitation didn't exist?",
-            "future_back_thinking": "What would this look like in 10 years?",
-            "cross_pollination": "How do other industries solve similar problems?"
-        }
-        
     def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute clarification workflow focused on design excellence and innovation:
@@ -67,16 +154,70 @@ class ClarificationEngine(BaseAgent):
         4. Prepare enhanced brief for creative agents
         """
         task_text = inputs.get('task_text', '')
-        context = inputs.get('context', {})
         design_domain = inputs.get('design_domain', 'ui_ux')
-        execution_mode = inputs.get('execution_mode', 'ship')
-        
+
         # Self-check for creative clarity
         self.self_check("What creative assumptions might limit breakthrough thinking?")
-        
+
         # Analyze ambiguity with design focus
         ambiguity_analysis = self._analyze_design_ambiguity(task_text, design_domain)
-        
+
+        return self._build_result(inputs, ambiguity_analysis)
+
+    def execute_batch(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute the clarification workflow over a queue of briefs.
+        Indicator scoring for all briefs runs through one NumPy-vectorized
+        pass per category, amortizing the Python-level overhead over the
+        batch; without numpy each brief goes through execute() serially.
+        """
+        if not inputs:
+            return []
+
+        if np is None:
+            return [self.execute(item) for item in inputs]
+
+        self.self_check("What creative assumptions might limit breakthrough thinking?")
+
+        texts = [item.get('task_text', '').lower() for item in inputs]
+
+        # One (N briefs x K phrases) hit matrix per category, reduced in C
+        category_scores = {}
+        for category, (weight, phrases) in self.ambiguity_indicators.items():
+            hits = np.array([[text.count(phrase) > 0 for phrase in phrases] for text in texts])
+            category_scores[category] = np.maximum(0.0, 1.0 - hits.sum(axis=1) * weight)
+
+        # Domain indicators vary per brief, so score them item-wise
+        domain_scores = np.empty(len(texts))
+        for i, (text, item) in enumerate(zip(texts, inputs)):
+            phrases = self.domain_indicators.get(item.get('design_domain', 'ui_ux'), ())
+            found = sum(1 for phrase in phrases if phrase in text)
+            domain_scores[i] = max(0.0, 1.0 - (found * 0.3))
+
+        results = []
+        for i, item in enumerate(inputs):
+            indicators = {category: float(scores[i]) for category, scores in category_scores.items()}
+            indicators["design_context"] = float(domain_scores[i])
+            ambiguity_analysis = {
+                "indicators": indicators,
+                "overall_score": sum(indicators.values()) / len(indicators),
+                "high_ambiguity_areas": [
+                    area for area, score in indicators.items()
+                    if score > 0.6
+                ],
+                "domain": item.get('design_domain', 'ui_ux')
+            }
+            results.append(self._build_result(item, ambiguity_analysis))
+
+        return results
+
+    def _build_result(self, inputs: Dict[str, Any], ambiguity_analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the full clarification result from a finished ambiguity analysis."""
+        task_text = inputs.get('task_text', '')
+        context = inputs.get('context', {})
+        design_domain = inputs.get('design_domain', 'ui_ux')
+        execution_mode = inputs.get('execution_mode', 'ship')
+
         # Generate clarification questions
         clarification_questions = self._generate_design_clarification_questions(
             task_text, ambiguity_analysis, design_domain, execution_mode
@@ -110,14 +251,7 @@ class ClarificationEngine(BaseAgent):
         """Analyze ambiguity patterns specific to design and creative work."""
         
         # Design-specific ambiguity indicators
-        design_ambiguity_indicators = {
-            "outcome_clarity": self._assess_outcome_clarity(task_text),
-            "audience_definition": self._assess_audience_clarity(task_text),
-            "constraint_definition": self._assess_constraint_clarity(task_text),
-            "success_criteria": self._assess_success_criteria_clarity(task_text),
-            "innovation_scope": self._assess_innovation_scope_clarity(task_text),
-            "design_context": self._assess_design_context_clarity(task_text, design_domain)
-        }
+        design_ambiguity_indicators = self._assess_ambiguity_indicators(task_text, design_domain)
         
         # Calculate overall ambiguity score
         overall_ambiguity = sum(design_ambiguity_indicators.values()) / len(design_ambiguity_indicators)
@@ -199,52 +333,9 @@ class ClarificationEngine(BaseAgent):
         
         return questions
     
-    def _apply_innovation_frameworks(self, task_text: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _apply_innovation_frameworks(self, task_text: str, context: Dict[str, Any]) -> tuple:
         """Apply innovation frameworks for breakthrough thinking."""
-        
-        innovation_questions = []
-        
-        # Jobs-to-be-Done framework
-        innovation_questions.append({
-            "framework": "jobs_to_be_done",
-            "question": "What job is the user truly hiring this design to accomplish? What's the deeper need?",
-            "thinking_mode": "user_motivation",
-            "breakthrough_potential": "high"
-        })
-        
-        # First principles thinking
-        innovation_questions.append({
-            "framework": "first_principles",
-            "question": "If we started from scratch with no assumptions, how would we solve this?",
-            "thinking_mode": "fundamental_truths",
-            "breakthrough_potential": "high"
-        })
-        
-        # Constraint removal
-        innovation_questions.append({
-            "framework": "constraint_removal",
-            "question": "What would we design if technical limitations, budget, or time didn't exist?",
-            "thinking_mode": "possibility_expansion",
-            "breakthrough_potential": "medium"
-        })
-        
-        # Future-back thinking
-        innovation_questions.append({
-            "framework": "future_back_thinking",
-            "question": "How will users interact with this in 10 years? What would feel magical then?",
-            "thinking_mode": "future_vision",
-            "breakthrough_potential": "high"
-        })
-        
-        # Cross-pollination
-        innovation_questions.append({
-            "framework": "cross_pollination",
-            "question": "How do completely different industries handle similar challenges?",
-            "thinking_mode": "pattern_transfer",
-            "breakthrough_potential": "medium"
-        })
-        
-        return innovation_questions
+        return _INNOVATION_QUESTIONS
     
     def _create_enhanced_design_brief(
         self,
@@ -254,110 +345,62 @@ class ClarificationEngine(BaseAgent):
         innovation_questions: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Create an enhanced design brief with clarity and innovation focus."""
-        
+
+        priority_clarifications = [
+            q for q in clarification_questions if q["priority"] == "high"
+        ]
+        high_potential_areas = [
+            q for q in innovation_questions if q["breakthrough_potential"] == "high"
+        ]
+
         return {
             "original_task": task_text,
             "enhanced_context": context,
             "clarity_requirements": {
                 "questions_to_resolve": clarification_questions,
                 "ambiguity_areas": [q["category"] for q in clarification_questions],
-                "priority_clarifications": [
-                    q for q in clarification_questions if q["priority"] == "high"
-                ]
+                "priority_clarifications": priority_clarifications
             },
             "innovation_opportunities": {
                 "breakthrough_questions": innovation_questions,
                 "thinking_frameworks": [q["framework"] for q in innovation_questions],
-                "high_potential_areas": [
-                    q for q in innovation_questions if q["breakthrough_potential"] == "high"
-                ]
+                "high_potential_areas": high_potential_areas
             },
             "design_readiness": {
                 "clarity_score": self._calculate_clarity_score(clarification_questions),
                 "innovation_priming": self._calculate_innovation_priming(innovation_questions),
                 "ready_for_execution": len(clarification_questions) < 3
             },
-            "next_steps": self._generate_next_steps(clarification_questions, innovation_questions)
-        }
-    
-    def _assess_outcome_clarity(self, task_text: str) -> float:
-        """Assess clarity of desired outcome."""
-        clarity_indicators = [
-            "will result in", "so that", "in order to", "the goal is",
-            "users will be able to", "success looks like", "the outcome"
-        ]
-        
-        text_lower = task_text.lower()
-        found_indicators = sum(1 for indicator in clarity_indicators if indicator in text_lower)
-        
-        # Higher score = more ambiguous (less clear)
-        return max(0.0, 1.0 - (found_indicators * 0.3))
-    
-    def _assess_audience_clarity(self, task_text: str) -> float:
-        """Assess clarity of target audience."""
-        audience_indicators = [
-            "users", "customers", "for people who", "target audience",
-            "persona", "user type", "demographic", "segment"
-        ]
-        
-        text_lower = task_text.lower()
-        found_indicators = sum(1 for indicator in audience_indicators if indicator in text_lower)
-        
-        return max(0.0, 1.0 - (found_indicators * 0.25))
-    
-    def _assess_constraint_clarity(self, task_text: str) -> float:
-        """Assess clarity of constraints and limitations."""
-        constraint_indicators = [
-            "constraint", "limitation", "requirement", "must", "cannot",
-            "within", "budget", "timeline", "technical", "platform"
-        ]
-        
-        text_lower = task_text.lower()
-        found_indicators = sum(1 for indicator in constraint_indicators if indicator in text_lower)
-        
-        return max(0.0, 1.0 - (found_indicators * 0.2))
-    
-    def _assess_success_criteria_clarity(self, task_text: str) -> float:
-        """Assess clarity of success criteria."""
-        success_indicators = [
-            "success", "measure", "metric", "kpi", "goal", "target",
-            "achieve", "improve", "increase", "reduce", "optimize"
-        ]
-        
-        text_lower = task_text.lower()
-        found_indicators = sum(1 for indicator in success_indicators if indicator in text_lower)
-        
-        return max(0.0, 1.0 - (found_indicators * 0.25))
-    
-    def _assess_innovation_scope_clarity(self, task_text: str) -> float:
-        """Assess clarity of innovation ambition."""
-        innovation_indicators = [
-            "innovative", "breakthrough", "revolutionary", "reimagine",
-            "disrupt", "transform", "novel", "creative", "original"
-        ]
-        
-        text_lower = task_text.lower()
-        found_indicators = sum(1 for indicator in innovation_indicators if indicator in text_lower)
-        
-        return max(0.0, 1.0 - (found_indicators * 0.3))
-    
-    def _assess_design_context_clarity(self, task_text: str, design_domain: str) -> float:
-        """Assess clarity of design context."""
-        domain_indicators = {
-            "ui_ux": ["interface", "experience", "usability", "interaction"],
-            "product_strategy": ["strategy", "vision", "roadmap", "market"],
-            "brand_identity": ["brand", "identity", "voice", "personality"],
-            "service_design": ["service", "touchpoint", "journey", "experience"],
-            "innovation_strategy": ["innovation", "disruption", "opportunity", "future"],
-            "design_systems": ["system", "scalable", "consistent", "components"]
+            "next_steps": self._generate_next_steps(
+                len(clarification_questions), len(priority_clarifications), len(high_potential_areas)
+            )
         }
-        
-        relevant_indicators = domain_indicators.get(design_domain, [])
-        text_lower = task_text.lower()
-        found_indicators = sum(1 for indicator in relevant_indicators if indicator in text_lower)
-        
-        return max(0.0, 1.0 - (found_indicators * 0.3))
     
+    def _assess_ambiguity_indicators(self, task_text: str, design_domain: str) -> Dict[str, float]:
+        """Assess all ambiguity categories in one pass over a pre-encoded buffer."""
+
+        # Encode once; bytes.find scans with the C memmem fast path
+        buffer = task_text.lower().encode("ascii", "ignore")
+
+        # Plain accumulator loops: no generator frame overhead per category
+        find = buffer.find
+        indicators = {}
+        for category, (weight, _phrases) in self.ambiguity_indicators.items():
+            found = 0
+            for phrase in self._indicator_bytes[category]:
+                if find(phrase) != -1:
+                    found += 1
+            # Higher score = more ambiguous (less clear)
+            indicators[category] = max(0.0, 1.0 - (found * weight))
+
+        found = 0
+        for phrase in self._domain_indicator_bytes.get(design_domain, ()):
+            if find(phrase) != -1:
+                found += 1
+        indicators["design_context"] = max(0.0, 1.0 - (found * 0.3))
+
+        return indicators
+
     def _get_domain_specific_questions(self, design_domain: str, task_text: str) -> List[Dict[str, Any]]:
         """Generate domain-specific clarification questions."""
         
@@ -469,29 +512,27 @@ class ClarificationEngine(BaseAgent):
         return 1.0 - overall_ambiguity
     
     def _generate_next_steps(
-        self, 
-        clarification_questions: List[Dict[str, Any]], 
-        innovation_questions: List[Dict[str, Any]]
+        self,
+        clarification_count: int,
+        high_priority_count: int,
+        high_potential_count: int
     ) -> List[str]:
-        """Generate recommended next steps."""
-        
+        """Generate recommended next steps from counts already gathered for the brief."""
+
         next_steps = []
-        
-        if clarification_questions:
-            high_priority = [q for q in clarification_questions if q["priority"] == "high"]
-            if high_priority:
-                next_steps.append(f"Resolve {len(high_priority)} high-priority clarifications before proceeding")
+
+        if clarification_count:
+            if high_priority_count:
+                next_steps.append(f"Resolve {high_priority_count} high-priority clarifications before proceeding")
             else:
                 next_steps.append("Address remaining clarifications for optimal results")
-        
-        if innovation_questions:
-            high_potential = [q for q in innovation_questions if q["breakthrough_potential"] == "high"]
-            if high_potential:
-                next_steps.append(f"Explore {len(high_potential)} high-potential innovation frameworks")
-        
-        if not clarification_questions:
+
+        if high_potential_count:
+            next_steps.append(f"Explore {high_potential_count} high-potential innovation frameworks")
+
+        if not clarification_count:
             next_steps.append("Ready for creative agent execution")
-        
+
         return next_steps
     
     def _identify_assumptions(self) -> List[str]:
@@ -3,14 +3,46 @@ Creative Tension Pairing - Strategic Agent Collaboration
 Implements creative tension between agents for breakthrough design thinking and innovation.
 """
 
+import copy
+import hashlib
 import json
-import time
-from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime
+import sys
+from collections import OrderedDict
+from typing import Dict, Any, List, Mapping, Optional, Sequence
 from enum import Enum
+from functools import lru_cache
+from statistics import fmean
+from types import MappingProxyType
 
 from fusion_agents import BaseAgent
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _score_all(weights, features):
+    """Score every tension type at once: (n_types, n_features) @ (n_features,)."""
+    return np.minimum(weights @ features, 1.0)
+
+
+def _agg_confidence(scores, uncertainty):
+    """Pairing confidence: 0.6 * mean(pair scores) + 0.4 * context clarity."""
+    return (scores.mean() * 0.6) + ((1.0 - uncertainty) * 0.4)
+
+
+if njit is not None:
+    # LLVM-compiled kernels; cache=True keeps the one-off compile off warm
+    # starts, and the explicit signature avoids per-dtype recompiles
+    _score_all = njit(cache=True, fastmath=True)(_score_all)
+    _agg_confidence = njit("float64(float64[:], float64)", cache=True, fastmath=True)(_agg_confidence)
+
 
 class TensionType(Enum):
     """Types of creative tension that drive breakthrough thinking."""
@@ -23,11 +55,404 @@ class TensionType(Enum):
     SPEED_VS_QUALITY = "speed_vs_quality"
 
 
+# Static lookup tables shared by every CreativeTensionPairing instance.
+# Built once at module load; inner sequences are tuples so the tables stay
+# immutable and shareable.
+TENSION_FRAMEWORKS = {
+    TensionType.VISION_VS_EXECUTION: {
+        "description": "Visionary thinking vs. practical implementation",
+        "optimal_pairs": (
+            ("StrategyPilot", "DesignTechnologist"),
+            ("CreativeDirector", "CriticalDesignAdvisor")
+        ),
+        "synthesis_approach": "staged_realization",
+        "breakthrough_potential": "paradigm_shifts",
+        "conflict_value": "prevents_premature_optimization_and_under_ambition"
+    },
+    TensionType.INNOVATION_VS_FEASIBILITY: {
+        "description": "Breakthrough innovation vs. realistic constraints",
+        "optimal_pairs": (
+            ("CreativeDirector", "DesignTechnologist"),
+            ("StrategyPilot", "CriticalDesignAdvisor")
+        ),
+        "synthesis_approach": "constraint_innovation",
+        "breakthrough_potential": "feasible_breakthroughs",
+        "conflict_value": "ensures_implementable_innovation"
+    },
+    TensionType.USER_VS_BUSINESS: {
+        "description": "User experience excellence vs. business objectives",
+        "optimal_pairs": (
+            ("DesignMaestro", "StrategyPilot"),
+            ("CreativeDirector", "StrategyPilot")
+        ),
+        "synthesis_approach": "value_alignment",
+        "breakthrough_potential": "win_win_solutions",
+        "conflict_value": "prevents_user_neglect_and_business_blindness"
+    },
+    TensionType.CREATIVE_VS_STRATEGIC: {
+        "description": "Creative expression vs. strategic alignment",
+        "optimal_pairs": (
+            ("CreativeDirector", "StrategyPilot"),
+            ("DesignMaestro", "StrategyPilot")
+        ),
+        "synthesis_approach": "strategic_creativity",
+        "breakthrough_potential": "brand_differentiation",
+        "conflict_value": "balances_expression_with_purpose"
+    },
+    TensionType.EXPLORATION_VS_OPTIMIZATION: {
+        "description": "Broad exploration vs. focused optimization",
+        "optimal_pairs": (
+            ("CreativeDirector", "CriticalDesignAdvisor"),
+            ("DesignMaestro", "CriticalDesignAdvisor")
+        ),
+        "synthesis_approach": "staged_focusing",
+        "breakthrough_potential": "optimized_innovations",
+        "conflict_value": "prevents_tunnel_vision_and_endless_exploration"
+    },
+    TensionType.DEPTH_VS_BREADTH: {
+        "description": "Deep specialization vs. comprehensive coverage",
+        "optimal_pairs": (
+            ("CriticalDesignAdvisor", "DesignMaestro"),
+            ("DesignTechnologist", "StrategyPilot")
+        ),
+        "synthesis_approach": "layered_analysis",
+        "breakthrough_potential": "comprehensive_excellence",
+        "conflict_value": "ensures_both_depth_and_completeness"
+    },
+    TensionType.SPEED_VS_QUALITY: {
+        "description": "Rapid iteration vs. quality excellence",
+        "optimal_pairs": (
+            ("DesignTechnologist", "CriticalDesignAdvisor"),
+            ("CreativeDirector", "CriticalDesignAdvisor")
+        ),
+        "synthesis_approach": "quality_velocity",
+        "breakthrough_potential": "efficient_excellence",
+        "conflict_value": "optimizes_both_speed_and_quality"
+    }
+}
+
+# Relevance scoring rules per tension type: (analysis section, key, weight)
+SCORING_RULES = {
+    TensionType.VISION_VS_EXECUTION: (
+        ("design_challenges", "implementation_clarity", 0.3),
+        ("creative_ambition", "visionary_scope", 0.4),
+        ("innovation_needs", "paradigm_shift_potential", 0.3)
+    ),
+    TensionType.INNOVATION_VS_FEASIBILITY: (
+        ("innovation_needs", "breakthrough_requirement", 0.4),
+        ("design_challenges", "technical_constraints", 0.3),
+        ("creative_ambition", "innovation_risk", 0.3)
+    ),
+    TensionType.USER_VS_BUSINESS: (
+        ("design_challenges", "stakeholder_alignment", 0.4),
+        ("strategic_complexity", "business_pressure", 0.3),
+        ("design_challenges", "user_business_conflict", 0.3)
+    ),
+    TensionType.CREATIVE_VS_STRATEGIC: (
+        ("creative_ambition", "expression_importance", 0.4),
+        ("strategic_complexity", "strategic_alignment_need", 0.3),
+        ("design_challenges", "brand_strategy_tension", 0.3)
+    ),
+    TensionType.EXPLORATION_VS_OPTIMIZATION: (
+        ("innovation_needs", "exploration_requirement", 0.4),
+        ("design_challenges", "optimization_opportunity", 0.3),
+        ("execution_constraints", "time_pressure", 0.3)
+    ),
+    TensionType.DEPTH_VS_BREADTH: (
+        ("design_challenges", "complexity_scope", 0.4),
+        ("strategic_complexity", "comprehensive_analysis_need", 0.3),
+        ("innovation_needs", "thorough_exploration", 0.3)
+    ),
+    TensionType.SPEED_VS_QUALITY: (
+        ("execution_constraints", "speed_pressure", 0.4),
+        ("design_challenges", "quality_requirements", 0.3),
+        ("strategic_complexity", "delivery_pressure", 0.3)
+    )
+}
+
+TENSION_TYPES = tuple(TensionType)
+
+# Plain-dict views of the enum for hot-path lookups: Enum.__call__ walks the
+# _missing_ machinery, a dict hit is a single hash probe
+TENSION_BY_NAME = {tension_type.value: tension_type for tension_type in TENSION_TYPES}
+TENSION_INDEX = {tension_type: index for index, tension_type in enumerate(TENSION_TYPES)}
+
+# Flattened feature layout and weight matrix so all seven tension types can be
+# scored with one matmul + argmax instead of seven interpreted scoring passes
+FEATURE_ORDER = tuple(dict.fromkeys(
+    (section, key)
+    for rules in SCORING_RULES.values()
+    for section, key, _weight in rules
+))
+
+if np is not None:
+    SCORING_WEIGHTS = np.zeros((len(TENSION_TYPES), len(FEATURE_ORDER)), dtype=np.float32)
+    _feature_index = {feature: i for i, feature in enumerate(FEATURE_ORDER)}
+    for _row, _tension_type in enumerate(TENSION_TYPES):
+        for _section, _key, _weight in SCORING_RULES[_tension_type]:
+            SCORING_WEIGHTS[_row, _feature_index[(_section, _key)]] = _weight
+    del _feature_index, _row, _tension_type, _section, _key, _weight
+else:
+    SCORING_WEIGHTS = None
+
+# Per-approach synthesis plans built once at module load; the result builder
+# returns shared references instead of rebuilding ~30 dicts per call. Inner plans
+# stay plain dicts so cached execute() results remain deepcopy-able.
+SYNTHESIS_PLANS = MappingProxyType({
+    "staged_realization": {
+        "approach": "vision_then_implementation",
+        "stages": ("envision", "reality_check", "bridge_building", "staged_execution"),
+        "synthesis_method": "iterative_refinement"
+    },
+    "constraint_innovation": {
+        "approach": "constraint_driven_creativity",
+        "stages": ("constraint_mapping", "creative_exploration", "feasibility_testing", "innovative_solution"),
+        "synthesis_method": "constraint_as_catalyst"
+    },
+    "value_alignment": {
+        "approach": "shared_value_discovery",
+        "stages": ("stakeholder_mapping", "value_intersection", "win_win_ideation", "aligned_solution"),
+        "synthesis_method": "value_optimization"
+    },
+    "strategic_creativity": {
+        "approach": "purpose_driven_expression",
+        "stages": ("strategic_foundation", "creative_exploration", "brand_alignment", "strategic_expression"),
+        "synthesis_method": "purpose_creativity_fusion"
+    },
+    "staged_focusing": {
+        "approach": "explore_then_optimize",
+        "stages": ("broad_exploration", "pattern_identification", "focus_selection", "optimization"),
+        "synthesis_method": "funnel_approach"
+    },
+    "layered_analysis": {
+        "approach": "depth_and_breadth_integration",
+        "stages": ("comprehensive_mapping", "deep_dive_selection", "integration", "complete_solution"),
+        "synthesis_method": "multi_dimensional_synthesis"
+    },
+    "quality_velocity": {
+        "approach": "iterative_quality_acceleration",
+        "stages": ("rapid_iteration", "quality_gates", "velocity_optimization", "quality_velocity_balance"),
+        "synthesis_method": "spiral_improvement"
+    }
+})
+
+# Which tension strengths cover a given complementary weakness
+STRENGTH_COMPLEMENTS = {
+    "creative_exploration": frozenset(("breakthrough_thinking", "creative_innovation")),
+    "user_empathy": frozenset(("user_advocacy", "experience_quality")),
+    "tactical_execution": frozenset(("technical_innovation", "implementation_excellence")),
+    "strategic_alignment": frozenset(("strategic_thinking", "market_reality")),
+    "technical_constraints": frozenset(("technical_innovation", "practical_constraints")),
+    "business_metrics": frozenset(("strategic_thinking", "viability_assessment"))
+}
+
+AGENT_CHARACTERISTICS = {
+    "StrategyPilot": {
+        "natural_tendencies": ("strategic_thinking", "business_focus", "long_term_vision"),
+        "tension_strengths": frozenset(("market_reality", "strategic_alignment", "viability_assessment")),
+        "complementary_weaknesses": frozenset(("creative_exploration", "user_empathy", "tactical_execution"))
+    },
+    "CreativeDirector": {
+        "natural_tendencies": ("creative_innovation", "brand_expression", "user_inspiration"),
+        "tension_strengths": frozenset(("breakthrough_thinking", "emotional_resonance", "narrative_power")),
+        "complementary_weaknesses": frozenset(("strategic_alignment", "technical_constraints", "business_metrics"))
+    },
+    "DesignMaestro": {
+        "natural_tendencies": ("user_experience", "journey_optimization", "interaction_excellence"),
+        "tension_strengths": frozenset(("user_advocacy", "experience_quality", "friction_detection")),
+        "complementary_weaknesses": frozenset(("business_strategy", "technical_implementation", "brand_expression"))
+    },
+    "DesignTechnologist": {
+        "natural_tendencies": ("technical_feasibility", "implementation_excellence", "systematic_thinking"),
+        "tension_strengths": frozenset(("practical_constraints", "technical_innovation", "scalability_awareness")),
+        "complementary_weaknesses": frozenset(("creative_vision", "user_empathy", "strategic_perspective"))
+    },
+    "CriticalDesignAdvisor": {
+        "natural_tendencies": ("analytical_thinking", "quality_assessment", "systematic_evaluation"),
+        "tension_strengths": frozenset(("objective_analysis", "risk_identification", "quality_standards")),
+        "complementary_weaknesses": frozenset(("creative_generation", "visionary_thinking", "rapid_iteration"))
+    }
+}
+
+
+@lru_cache(maxsize=64)
+def _analyze_pair_dynamics_cached(agent1: str, agent2: str, tension_type: TensionType) -> Dict[str, Any]:
+    """
+    Analyze the dynamics between a specific agent pair.
+    The analysis depends only on the two characteristic sets and the tension
+    type, so each pairing is computed once and served from the cache after.
+    """
+    framework = TENSION_FRAMEWORKS[tension_type]
+    char1 = AGENT_CHARACTERISTICS[agent1]
+    char2 = AGENT_CHARACTERISTICS[agent2]
+
+    # Identify conflict areas (productive tension points) via set intersection
+    conflict_areas = tuple(
+        f"{agent1}_{strength}_vs_{agent2}_weakness"
+        for strength in sorted(char1["tension_strengths"] & char2["complementary_weaknesses"])
+    ) + tuple(
+        f"{agent2}_{strength}_vs_{agent1}_weakness"
+        for strength in sorted(char2["tension_strengths"] & char1["complementary_weaknesses"])
+    )
+
+    # Identify complementary strengths
+    strengths2 = char2["tension_strengths"]
+    complementary_strengths = tuple(
+        f"{weakness}_complemented_by_{agent2}"
+        for weakness in sorted(char1["complementary_weaknesses"])
+        if strengths2 & STRENGTH_COMPLEMENTS.get(weakness, frozenset())
+    )
+
+    # Calculate tension score
+    tension_score = len(conflict_areas) * 0.3 + len(complementary_strengths) * 0.4 + 0.3
+
+    return {
+        "conflict_areas": conflict_areas,
+        "complementary_strengths": complementary_strengths,
+        "tension_score": tension_score if tension_score < 1.0 else 1.0,
+        "breakthrough_potential": framework["breakthrough_potential"],
+        "synthesis_approach": framework["synthesis_approach"]
+    }
+
+
+# Constant helper payloads, built once at import. Mapping-valued constants stay
+# plain dicts (not MappingProxyType) so cached execute() results deepcopy cleanly.
+_BREAKTHROUGH_THRESHOLDS = {
+    "innovation_score": 0.8,
+    "synthesis_quality": 0.7,
+    "strategic_alignment": 0.8,
+    "creative_excellence": 0.7,
+    "feasibility_confidence": 0.6
+}
+
+_INTERVENTION_TRIGGERS = (
+    "unproductive_conflict_detected",
+    "synthesis_stagnation",
+    "breakthrough_opportunity_identified",
+    "tension_intensity_too_low",
+    "conflict_resolution_needed"
+)
+
+_PRODUCTIVE_INDICATORS = (
+    "new_insights_generated",
+    "creative_solutions_emerging",
+    "quality_improvements_identified",
+    "strategic_clarity_increasing",
+    "breakthrough_patterns_visible"
+)
+
+_WARNING_SIGNS = (
+    "personal_conflict_emerging",
+    "circular_arguments",
+    "quality_degradation",
+    "stakeholder_confusion",
+    "synthesis_avoidance"
+)
+
+_BREAKTHROUGH_INDICATORS_BY_TYPE = {
+    TensionType.VISION_VS_EXECUTION: (
+        "visionary_concepts_with_clear_implementation_path",
+        "practical_solutions_with_inspiring_vision",
+        "staged_realization_roadmap_clarity"
+    ),
+    TensionType.INNOVATION_VS_FEASIBILITY: (
+        "innovative_solutions_within_constraints",
+        "constraint_driven_creative_breakthroughs",
+        "feasible_paradigm_shifts"
+    ),
+    TensionType.USER_VS_BUSINESS: (
+        "win_win_value_propositions",
+        "user_delight_driving_business_success",
+        "business_model_innovation_benefiting_users"
+    )
+}
+
+_DEFAULT_BREAKTHROUGH_INDICATORS = (
+    "creative_breakthrough_achieved",
+    "strategic_innovation_identified"
+)
+
+_CONFLICT_RESOLUTION = {
+    "resolution_philosophy": "synthesis_over_compromise",
+    "intervention_style": "facilitative_guidance",
+    "breakthrough_catalyst": "reframe_tension_as_opportunity",
+    "synthesis_method": "creative_integration"
+}
+
+_FACILITATION_STYLES = {
+    TensionType.VISION_VS_EXECUTION: "visionary_pragmatist",
+    TensionType.INNOVATION_VS_FEASIBILITY: "constraint_catalyst",
+    TensionType.USER_VS_BUSINESS: "value_alignment_facilitator",
+    TensionType.CREATIVE_VS_STRATEGIC: "purpose_driven_creativity",
+    TensionType.EXPLORATION_VS_OPTIMIZATION: "progressive_focusing",
+    TensionType.DEPTH_VS_BREADTH: "comprehensive_synthesis",
+    TensionType.SPEED_VS_QUALITY: "velocity_quality_optimizer"
+}
+
+_SYNTHESIS_TIMING = {
+    TensionType.VISION_VS_EXECUTION: "after_exploration_phase",
+    TensionType.INNOVATION_VS_FEASIBILITY: "iterative_checkpoint",
+    TensionType.USER_VS_BUSINESS: "value_alignment_reached",
+    TensionType.CREATIVE_VS_STRATEGIC: "creative_options_generated",
+    TensionType.EXPLORATION_VS_OPTIMIZATION: "exploration_saturation",
+    TensionType.DEPTH_VS_BREADTH: "comprehensive_coverage_achieved",
+    TensionType.SPEED_VS_QUALITY: "quality_velocity_balance_found"
+}
+
+_INTERVENTION_TECHNIQUES = (
+    "reframe_conflict_as_creative_opportunity",
+    "identify_shared_values_and_goals",
+    "facilitate_perspective_taking_exercises",
+    "guide_synthesis_thinking",
+    "catalyze_breakthrough_moments"
+)
+
+_BREAKTHROUGH_ACCELERATION = (
+    "amplify_productive_tension_patterns",
+    "introduce_synthesis_catalysts",
+    "facilitate_creative_leaps",
+    "connect_disparate_insights",
+    "enable_innovative_integration"
+)
+
+_CONFLICT_NAVIGATION = (
+    "acknowledge_valid_perspectives",
+    "identify_underlying_needs_and_values",
+    "explore_creative_alternatives",
+    "facilitate_collaborative_problem_solving",
+    "guide_toward_synthesis_solutions"
+)
+
+_SYNTHESIS_FACILITATION = (
+    "pattern_recognition_and_integration",
+    "creative_combination_of_perspectives",
+    "strategic_alignment_of_solutions",
+    "innovative_resolution_development",
+    "breakthrough_insight_crystallization"
+)
+
+_SUCCESS_AMPLIFICATION = (
+    "recognize_and_celebrate_breakthroughs",
+    "document_successful_tension_patterns",
+    "share_insights_across_agent_network",
+    "refine_synthesis_approaches",
+    "build_creative_momentum"
+)
+
+# Intern the identifiers that recur across the framework tables so dict-key
+# comparisons can short-circuit on pointer equality
+AGENT_IDS = tuple(sys.intern(name) for name in AGENT_CHARACTERISTICS)
+SYNTHESIS_APPROACHES = tuple(sys.intern(tag) for tag in SYNTHESIS_PLANS)
+
+
 class CreativeTensionPairing(BaseAgent):
     """
     Manages creative tension between agents to generate breakthrough insights.
     Focuses on productive conflict that drives design innovation and strategic thinking.
     """
+
+    # Only the shared-table bindings and the execute cache live per instance
+    __slots__ = ("tension_frameworks", "agent_characteristics", "_exec_cache", "_exec_cache_size", "_trace")
     
     def __init__(self):
         super().__init__(
@@ -52,107 +477,19 @@ class CreativeTensionPairing(BaseAgent):
             }
         )
         
-        self.tension_frameworks = {
-            TensionType.VISION_VS_EXECUTION: {
-                "description": "Visionary thinking vs. practical implementation",
-                "optimal_pairs": [
-                    ("StrategyPilot", "DesignTechnologist"),
-                    ("CreativeDirector", "CriticalDesignAdvisor")
-                ],
-                "synthesis_approach": "staged_realization",
-                "breakthrough_potential": "paradigm_shifts",
-                "conflict_value": "prevents_premature_optimization_and_under_ambition"
-            },
-            TensionType.INNOVATION_VS_FEASIBILITY: {
-                "description": "Breakthrough innovation vs. realistic constraints",
-                "optimal_pairs": [
-                    ("CreativeDirector", "DesignTechnologist"),
-                    ("StrategyPilot", "CriticalDesignAdvisor")
-                ],
-                "synthesis_approach": "constraint_innovation",
-                "breakthrough_potential": "feasible_breakthroughs",
-                "conflict_value": "ensures_implementable_innovation"
-            },
-            TensionType.USER_VS_BUSINESS: {
-                "description": "User experience excellence vs. business objectives",
-                "optimal_pairs": [
-                    ("DesignMaestro", "StrategyPilot"),
-                    ("CreativeDirector", "StrategyPilot")
-                ],
-                "synthesis_approach": "value_alignment",
-                "breakthrough_potential": "win_win_solutions",
-                "conflict_value": "prevents_user_neglect_and_business_blindness"
-            },
-            TensionType.CREATIVE_VS_STRATEGIC: {
-                "description": "Creative expression vs. strategic alignment",
-                "optimal_pairs": [
-                    ("CreativeDirector", "StrategyPilot"),
-                    ("DesignMaestro", "StrategyPilot")
-                ],
-                "synthesis_approach": "strategic_creativity",
-                "breakthrough_potential": "brand_differentiation",
-                "conflict_value": "balances_expression_with_purpose"
-            },
-            TensionType.EXPLORATION_VS_OPTIMIZATION: {
-                "description": "Broad exploration vs. focused optimization",
-                "optimal_pairs": [
-                    ("CreativeDirector", "CriticalDesignAdvisor"),
-                    ("DesignMaestro", "CriticalDesignAdvisor")
-                ],
-                "synthesis_approach": "staged_focusing",
-                "breakthrough_potential": "optimized_innovations",
-                "conflict_value": "prevents_tunnel_vision_and_endless_exploration"
-            },
-            TensionType.DEPTH_VS_BREADTH: {
-                "description": "Deep specialization vs. comprehensive coverage",
-                "optimal_pairs": [
-                    ("CriticalDesignAdvisor", "DesignMaestro"),
-                    ("DesignTechnologist", "StrategyPilot")
-                ],
-                "synthesis_approach": "layered_analysis",
-                "breakthrough_potential": "comprehensive_excellence",
-                "conflict_value": "ensures_both_depth_and_completeness"
-            },
-            TensionType.SPEED_VS_QUALITY: {
-                "description": "Rapid iteration vs. quality excellence",
-                "optimal_pairs": [
-                    ("DesignTechnologist", "CriticalDesignAdvisor"),
-                    ("CreativeDirector", "CriticalDesignAdvisor")
-                ],
-                "synthesis_approach": "quality_velocity",
-                "breakthrough_potential": "efficient_excellence",
-                "conflict_value": "optimizes_both_speed_and_quality"
-            }
-        }
-        
-        self.agent_characteristics = {
-            "StrategyPilot": {
-                "natural_tendencies": ["strategic_thinking", "business_focus", "long_term_vision"],
-                "tension_strengths": ["market_reality", "strategic_alignment", "viability_assessment"],
-                "complementary_weaknesses": ["creative_exploration", "user_empathy", "tactical_execution"]
-            },
-            "CreativeDirector": {
-                "natural_tendencies": ["creative_innovation", "brand_expression", "user_inspiration"],
-                "tension_strengths": ["breakthrough_thinking", "emotional_resonance", "narrative_power"],
-                "complementary_weaknesses": ["strategic_alignment", "technical_constraints", "business_metrics"]
-            },
-            "DesignMaestro": {
-                "natural_tendencies": ["user_experience", "journey_optimization", "interaction_excellence"],
-                "tension_strengths": ["user_advocacy", "experience_quality", "friction_detection"],
-                "complementary_weaknesses": ["business_strategy", "technical_implementation", "brand_expression"]
-            },
-            "DesignTechnologist": {
-                "natural_tendencies": ["technical_feasibility", "implementation_excellence", "systematic_thinking"],
-                "tension_strengths": ["practical_constraints", "technical_innovation", "scalability_awareness"],
-                "complementary_weaknesses": ["creative_vision", "user_empathy", "strategic_perspective"]
-            },
-            "CriticalDesignAdvisor": {
-                "natural_tendencies": ["analytical_thinking", "quality_assessment", "systematic_evaluation"],
-                "tension_strengths": ["objective_analysis", "risk_identification", "quality_standards"],
-                "complementary_weaknesses": ["creative_generation", "visionary_thinking", "rapid_iteration"]
-            }
-        }
-        
+        # Shared, immutable module-level tables (see TENSION_FRAMEWORKS above)
+        self.tension_frameworks = TENSION_FRAMEWORKS
+        self.agent_characteristics = AGENT_CHARACTERISTICS
+
+        # LRU cache of execute() results keyed by a hash of the input payload;
+        # advisory-board and critique loops frequently replay identical contexts
+        self._exec_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._exec_cache_size = 128
+
+        # Reasoning-trail self-checks are skipped unless tracing is enabled;
+        # in tight advisory-board loops the log appends outweigh the compute
+        self._trace = False
+
     def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """
         Orchestrate creative tension between agent pairs:
@@ -165,28 +502,143 @@ class CreativeTensionPairing(BaseAgent):
         requested_tension = inputs.get('tension_type', None)
         available_agents = inputs.get('agent_pool', list(self.agent_characteristics.keys()))
         execution_mode = inputs.get('execution_mode', 'ship')
+
+        # The pipeline is deterministic for a given payload, so replayed
+        # contexts can be answered straight from the cache
+        cache_key = hashlib.blake2b(
+            json.dumps(
+                [pairing_context, requested_tension, sorted(available_agents), execution_mode],
+                sort_keys=True,
+                default=str
+            ).encode(),
+            digest_size=16
+        ).digest()
+        cached = self._exec_cache.get(cache_key)
+        if cached is not None:
+            self._exec_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+
+        # Self-check for productive tension (only when tracing)
+        if self._trace:
+            self.self_check("What creative tension will generate the most breakthrough value?")
+
+        # A valid explicit request pins the tension type, so the five scoring
+        # sub-analyzers can be skipped entirely
+        optimal_tension = TENSION_BY_NAME.get(requested_tension) if requested_tension else None
+        if optimal_tension is not None:
+            tension_analysis = self._lightweight_tension_analysis(pairing_context, execution_mode)
+        else:
+            # Analyze context to determine optimal tension
+            tension_analysis = self._analyze_tension_needs(pairing_context, execution_mode)
+            optimal_tension = self._select_tension_type(tension_analysis, None)
         
-        # Self-check for productive tension
-        self.self_check("What creative tension will generate the most breakthrough value?")
-        
-        # Analyze context to determine optimal tension
-        tension_analysis = self._analyze_tension_needs(pairing_context, execution_mode)
-        
-        # Select tension type
-        optimal_tension = self._select_tension_type(tension_analysis, requested_tension)
-        
+        result = self._build_pairing_result(
+            optimal_tension, tension_analysis, pairing_context, available_agents, execution_mode
+        )
+
+        # Cache a private copy so caller mutations don't poison later hits
+        self._exec_cache[cache_key] = copy.deepcopy(result)
+        if len(self._exec_cache) > self._exec_cache_size:
+            self._exec_cache.popitem(last=False)
+
+        return result
+
+    def batch_execute(self, inputs_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute many pairing jobs back-to-back with one stacked scoring matmul.
+        Tension scoring for the whole batch runs as a single (N, n_features)
+        matrix product instead of N independent scoring passes.
+        """
+        if not inputs_list:
+            return []
+
+        if SCORING_WEIGHTS is None:
+            return [self.execute(inputs) for inputs in inputs_list]
+
+        if self._trace:
+            self.self_check("What creative tension will generate the most breakthrough value?")
+
+        analyses = [
+            self._analyze_tension_needs(
+                inputs.get('pairing_context', {}), inputs.get('execution_mode', 'ship')
+            )
+            for inputs in inputs_list
+        ]
+
+        features = np.stack([
+            np.fromiter(
+                (analysis[section].get(key, 0.0) for section, key in FEATURE_ORDER),
+                dtype=np.float32,
+                count=len(FEATURE_ORDER)
+            )
+            for analysis in analyses
+        ])
+        scores = np.minimum(features @ SCORING_WEIGHTS.T, 1.0)
+        best = scores.argmax(axis=1)
+
+        results = []
+        for inputs, tension_analysis, row in zip(inputs_list, analyses, best):
+            requested_tension = inputs.get('tension_type', None)
+            optimal_tension = TENSION_BY_NAME.get(requested_tension) if requested_tension else None
+            if optimal_tension is None:
+                optimal_tension = TENSION_TYPES[int(row)]
+
+            results.append(self._build_pairing_result(
+                optimal_tension,
+                tension_analysis,
+                inputs.get('pairing_context', {}),
+                inputs.get('agent_pool', list(self.agent_characteristics.keys())),
+                inputs.get('execution_mode', 'ship')
+            ))
+
+        return results
+
+    def _build_pairing_result(
+        self,
+        optimal_tension: TensionType,
+        tension_analysis: Dict[str, Any],
+        pairing_context: Dict[str, Any],
+        available_agents: List[str],
+        execution_mode: str
+    ) -> Dict[str, Any]:
+        """
+        Build the full pairing result for an already-selected tension type.
+        Configuration, synthesis planning and facilitation strategy are fused
+        into one pass over a single shared framework reference.
+        """
+
+        # Resolve the framework once and share it through the pipeline
+        framework = self.tension_frameworks[optimal_tension]
+
         # Select agent pairs
-        agent_pairs = self._select_agent_pairs(optimal_tension, available_agents, tension_analysis)
-        
+        agent_pairs = self._select_agent_pairs(optimal_tension, framework, available_agents, tension_analysis)
+
         # Configure tension parameters
-        tension_configuration = self._configure_tension_parameters(optimal_tension, agent_pairs, execution_mode)
-        
+        tension_configuration = {
+            "tension_intensity": self._calculate_tension_intensity(optimal_tension, execution_mode),
+            "conflict_tolerance": self._set_conflict_tolerance(optimal_tension, execution_mode),
+            "synthesis_timing": self._determine_synthesis_timing(optimal_tension, execution_mode),
+            "breakthrough_thresholds": self._set_breakthrough_thresholds(optimal_tension),
+            "facilitation_intervention_triggers": self._set_intervention_triggers(optimal_tension),
+            "productive_conflict_indicators": self._define_productive_indicators(optimal_tension),
+            "unproductive_conflict_warnings": self._define_warning_signs(optimal_tension),
+            "synthesis_success_criteria": framework["breakthrough_potential"]
+        }
+
         # Plan synthesis approach
-        synthesis_plan = self._plan_synthesis_approach(optimal_tension, agent_pairs, pairing_context)
-        
+        approach = framework["synthesis_approach"]
+        synthesis_plan = SYNTHESIS_PLANS.get(approach, SYNTHESIS_PLANS["staged_realization"])
+
         # Generate facilitation strategy
-        facilitation_strategy = self._generate_facilitation_strategy(optimal_tension, tension_configuration)
-        
+        facilitation_strategy = {
+            "facilitation_style": self._determine_facilitation_style(optimal_tension),
+            "intervention_techniques": self._define_intervention_techniques(optimal_tension),
+            "breakthrough_acceleration": self._define_breakthrough_acceleration(optimal_tension),
+            "conflict_navigation": self._define_conflict_navigation(optimal_tension),
+            "synthesis_facilitation": self._define_synthesis_facilitation(optimal_tension),
+            "success_amplification": self._define_success_amplification(optimal_tension)
+        }
+
         return {
             "tension_type": optimal_tension.value,
             "agent_pairs": agent_pairs,
@@ -229,6 +681,17 @@ class CreativeTensionPairing(BaseAgent):
             )
         }
     
+    def _lightweight_tension_analysis(self, pairing_context: Dict[str, Any], execution_mode: str) -> Dict[str, Any]:
+        """Minimal analysis for explicitly requested tensions; no scoring inputs needed."""
+        return {
+            "design_challenges": {},
+            "innovation_needs": {},
+            "strategic_complexity": {},
+            "creative_ambition": {},
+            "execution_constraints": self._assess_execution_constraints(pairing_context, execution_mode),
+            "primary_tension_driver": "explicit_request"
+        }
+    
     def _select_tension_type(
         self, 
         tension_analysis: Dict[str, Any], 
@@ -236,87 +699,56 @@ class CreativeTensionPairing(BaseAgent):
     ) -> TensionType:
         """Select the optimal tension type based on analysis."""
         
-        # If tension explicitly requested, validate and use
+        # If tension explicitly requested, validate and use; unknown names
+        # fall through to analytical selection without raising
         if requested_tension:
-            try:
-                return TensionType(requested_tension)
-            except ValueError:
-                pass  # Fall through to analytical selection
-        
-        # Tension scoring based on context analysis
-        tension_scores = {}
-        
-        # Score each tension type
-        for tension_type in TensionType:
+            tension_type = TENSION_BY_NAME.get(requested_tension)
+            if tension_type is not None:
+                return tension_type
+        
+        # Vectorized path: one matmul scores every tension type at once
+        if SCORING_WEIGHTS is not None:
+            features = np.fromiter(
+                (tension_analysis[section].get(key, 0.0) for section, key in FEATURE_ORDER),
+                dtype=np.float32,
+                count=len(FEATURE_ORDER)
+            )
+            scores = _score_all(SCORING_WEIGHTS, features)
+            return TENSION_TYPES[int(scores.argmax())]
+
+        # Fallback: streaming max over the tension types; no intermediate dict
+        best_tension, best_score = TENSION_TYPES[0], -1.0
+        for tension_type in TENSION_TYPES:
             score = self._score_tension_relevance(tension_type, tension_analysis)
-            tension_scores[tension_type] = score
-        
-        # Select highest scoring tension
-        return max(tension_scores.items(), key=lambda x: x[1])[0]
+            if score > best_score:
+                best_tension, best_score = tension_type, score
+        return best_tension
     
     def _score_tension_relevance(self, tension_type: TensionType, analysis: Dict[str, Any]) -> float:
         """Score how relevant a tension type is for the current context."""
-        
-        score = 0.0
-        challenges = analysis["design_challenges"]
-        innovation_needs = analysis["innovation_needs"]
-        strategic_complexity = analysis["strategic_complexity"]
-        creative_ambition = analysis["creative_ambition"]
-        
-        # Scoring logic for each tension type
-        if tension_type == TensionType.VISION_VS_EXECUTION:
-            score += challenges.get("implementation_clarity", 0) * 0.3
-            score += creative_ambition.get("visionary_scope", 0) * 0.4
-            score += innovation_needs.get("paradigm_shift_potential", 0) * 0.3
-        
-        elif tension_type == TensionType.INNOVATION_VS_FEASIBILITY:
-            score += innovation_needs.get("breakthrough_requirement", 0) * 0.4
-            score += challenges.get("technical_constraints", 0) * 0.3
-            score += creative_ambition.get("innovation_risk", 0) * 0.3
-        
-        elif tension_type == TensionType.USER_VS_BUSINESS:
-            score += challenges.get("stakeholder_alignment", 0) * 0.4
-            score += strategic_complexity.get("business_pressure", 0) * 0.3
-            score += challenges.get("user_business_conflict", 0) * 0.3
-        
-        elif tension_type == TensionType.CREATIVE_VS_STRATEGIC:
-            score += creative_ambition.get("expression_importance", 0) * 0.4
-            score += strategic_complexity.get("strategic_alignment_need", 0) * 0.3
-            score += challenges.get("brand_strategy_tension", 0) * 0.3
-        
-        elif tension_type == TensionType.EXPLORATION_VS_OPTIMIZATION:
-            score += innovation_needs.get("exploration_requirement", 0) * 0.4
-            score += challenges.get("optimization_opportunity", 0) * 0.3
-            score += analysis["execution_constraints"].get("time_pressure", 0) * 0.3
-        
-        elif tension_type == TensionType.DEPTH_VS_BREADTH:
-            score += challenges.get("complexity_scope", 0) * 0.4
-            score += strategic_complexity.get("comprehensive_analysis_need", 0) * 0.3
-            score += innovation_needs.get("thorough_exploration", 0) * 0.3
-        
-        elif tension_type == TensionType.SPEED_VS_QUALITY:
-            score += analysis["execution_constraints"].get("speed_pressure", 0) * 0.4
-            score += challenges.get("quality_requirements", 0) * 0.3
-            score += strategic_complexity.get("delivery_pressure", 0) * 0.3
-        
-        return min(score, 1.0)
+        # Each rule set's weights sum to 1.0 and the context features are in
+        # [0, 1], so the weighted sum is already bounded - no clip needed
+        return sum(
+            analysis[section].get(key, 0) * weight
+            for section, key, weight in SCORING_RULES[tension_type]
+        )
     
     def _select_agent_pairs(
-        self, 
-        tension_type: TensionType, 
-        available_agents: List[str], 
+        self,
+        tension_type: TensionType,
+        framework: Dict[str, Any],
+        available_agents: List[str],
         tension_analysis: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
         """Select optimal agent pairs for the tension type."""
         
-        framework = self.tension_frameworks[tension_type]
         optimal_pairs = framework["optimal_pairs"]
         
         selected_pairs = []
         
         for agent1, agent2 in optimal_pairs:
             if agent1 in available_agents and agent2 in available_agents:
-                pair_analysis = self._analyze_pair_dynamics(agent1, agent2, tension_type, tension_analysis)
+                pair_analysis = self._analyze_pair_dynamics(agent1, agent2, tension_type)
                 
                 selected_pairs.append({
                     "agent_1": agent1,
@@ -334,132 +766,9 @@ class CreativeTensionPairing(BaseAgent):
         
         return selected_pairs[:2]  # Return top 2 pairs
     
-    def _analyze_pair_dynamics(
-        self, 
-        agent1: str, 
-        agent2: str, 
-        tension_type: TensionType, 
-        tension_analysis: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Analyze the dynamics between a specific agent pair."""
-        
-        char1 = self.agent_characteristics[agent1]
-        char2 = self.agent_characteristics[agent2]
-        
-        # Identify conflict areas (productive tension points)
-        conflict_areas = []
-        for strength1 in char1["tension_strengths"]:
-            if strength1 in char2["complementary_weaknesses"]:
-                conflict_areas.append(f"{agent1}_{strength1}_vs_{agent2}_weakness")
-        
-        for strength2 in char2["tension_strengths"]:
-            if strength2 in char1["complementary_weaknesses"]:
-                conflict_areas.append(f"{agent2}_{strength2}_vs_{agent1}_weakness")
-        
-        # Identify complementary strengths
-        complementary_strengths = []
-        for weakness1 in char1["complementary_weaknesses"]:
-            if any(strength for strength in char2["tension_strengths"] if self._strengths_complement(weakness1, strength)):
-                complementary_strengths.append(f"{weakness1}_complemented_by_{agent2}")
-        
-        # Calculate tension score
-        tension_score = len(conflict_areas) * 0.3 + len(complementary_strengths) * 0.4 + 0.3
-        
-        return {
-            "conflict_areas": conflict_areas,
-            "complementary_strengths": complementary_strengths,
-            "tension_score": min(tension_score, 1.0),
-            "breakthrough_potential": self._assess_breakthrough_potential(agent1, agent2, tension_type),
-            "synthesis_approach": self._determine_synthesis_approach(agent1, agent2, tension_type)
-        }
-    
-    def _configure_tension_parameters(
-        self, 
-        tension_type: TensionType, 
-        agent_pairs: List[Dict[str, Any]], 
-        execution_mode: str
-    ) -> Dict[str, Any]:
-        """Configure parameters for productive tension management."""
-        
-        framework = self.tension_frameworks[tension_type]
-        
-        return {
-            "tension_intensity": self._calculate_tension_intensity(tension_type, execution_mode),
-            "conflict_tolerance": self._set_conflict_tolerance(tension_type, execution_mode),
-            "synthesis_timing": self._determine_synthesis_timing(tension_type, execution_mode),
-            "breakthrough_thresholds": self._set_breakthrough_thresholds(tension_type),
-            "facilitation_intervention_triggers": self._set_intervention_triggers(tension_type),
-            "productive_conflict_indicators": self._define_productive_indicators(tension_type),
-            "unproductive_conflict_warnings": self._define_warning_signs(tension_type),
-            "synthesis_success_criteria": framework["breakthrough_potential"]
-        }
-    
-    def _plan_synthesis_approach(
-        self, 
-        tension_type: TensionType, 
-        agent_pairs: List[Dict[str, Any]], 
-        context: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Plan how to synthesize insights from creative tension."""
-        
-        framework = self.tension_frameworks[tension_type]
-        approach = framework["synthesis_approach"]
-        
-        synthesis_plans = {
-            "staged_realization": {
-                "approach": "vision_then_implementation",
-                "stages": ["envision", "reality_check", "bridge_building", "staged_execution"],
-                "synthesis_method": "iterative_refinement"
-            },
-            "constraint_innovation": {
-                "approach": "constraint_driven_creativity",
-                "stages": ["constraint_mapping", "creative_exploration", "feasibility_testing", "innovative_solution"],
-                "synthesis_method": "constraint_as_catalyst"
-            },
-            "value_alignment": {
-                "approach": "shared_value_discovery",
-                "stages": ["stakeholder_mapping", "value_intersection", "win_win_ideation", "aligned_solution"],
-                "synthesis_method": "value_optimization"
-            },
-            "strategic_creativity": {
-                "approach": "purpose_driven_expression",
-                "stages": ["strategic_foundation", "creative_exploration", "brand_alignment", "strategic_expression"],
-                "synthesis_method": "purpose_creativity_fusion"
-            },
-            "staged_focusing": {
-                "approach": "explore_then_optimize",
-                "stages": ["broad_exploration", "pattern_identification", "focus_selection", "optimization"],
-                "synthesis_method": "funnel_approach"
-            },
-            "layered_analysis": {
-                "approach": "depth_and_breadth_integration",
-                "stages": ["comprehensive_mapping", "deep_dive_selection", "integration", "complete_solution"],
-                "synthesis_method": "multi_dimensional_synthesis"
-            },
-            "quality_velocity": {
-                "approach": "iterative_quality_acceleration",
-                "stages": ["rapid_iteration", "quality_gates", "velocity_optimization", "quality_velocity_balance"],
-                "synthesis_method": "spiral_improvement"
-            }
-        }
-        
-        return synthesis_plans.get(approach, synthesis_plans["staged_realization"])
-    
-    def _generate_facilitation_strategy(
-        self, 
-        tension_type: TensionType, 
-        tension_configuration: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Generate strategy for facilitating productive creative tension."""
-        
-        return {
-            "facilitation_style": self._determine_facilitation_style(tension_type),
-            "intervention_techniques": self._define_intervention_techniques(tension_type),
-            "breakthrough_acceleration": self._define_breakthrough_acceleration(tension_type),
-            "conflict_navigation": self._define_conflict_navigation(tension_type),
-            "synthesis_facilitation": self._define_synthesis_facilitation(tension_type),
-            "success_amplification": self._define_success_amplification(tension_type)
-        }
+    def _analyze_pair_dynamics(self, agent1: str, agent2: str, tension_type: TensionType) -> Dict[str, Any]:
+        """Analyze the dynamics between a specific agent pair (memoized)."""
+        return _analyze_pair_dynamics_cached(agent1, agent2, tension_type)
     
     def _identify_design_challenges(self, context: Dict[str, Any]) -> Dict[str, float]:
         """Identify design challenges from context."""
@@ -531,7 +840,7 @@ class CreativeTensionPairing(BaseAgent):
             "strategic_complexity": max(strategic_complexity.values())
         }
         
-        return max(drivers.items(), key=lambda x: x[1])[0]
+        return max(drivers, key=drivers.__getitem__)
     
     def _describe_tension_dynamic(self, agent1: str, agent2: str, tension_type: TensionType) -> str:
         """Describe the tension dynamic between two agents."""
@@ -543,29 +852,7 @@ class CreativeTensionPairing(BaseAgent):
     
     def _strengths_complement(self, weakness: str, strength: str) -> bool:
         """Check if a strength complements a weakness."""
-        
-        complements = {
-            "creative_exploration": ["breakthrough_thinking", "creative_innovation"],
-            "user_empathy": ["user_advocacy", "experience_quality"],
-            "tactical_execution": ["technical_innovation", "implementation_excellence"],
-            "strategic_alignment": ["strategic_thinking", "market_reality"],
-            "technical_constraints": ["technical_innovation", "practical_constraints"],
-            "business_metrics": ["strategic_thinking", "viability_assessment"]
-        }
-        
-        return strength in complements.get(weakness, [])
-    
-    def _assess_breakthrough_potential(self, agent1: str, agent2: str, tension_type: TensionType) -> str:
-        """Assess breakthrough potential for agent pair."""
-        
-        framework = self.tension_frameworks[tension_type]
-        return framework["breakthrough_potential"]
-    
-    def _determine_synthesis_approach(self, agent1: str, agent2: str, tension_type: TensionType) -> str:
-        """Determine synthesis approach for agent pair."""
-        
-        framework = self.tension_frameworks[tension_type]
-        return framework["synthesis_approach"]
+        return strength in STRENGTH_COMPLEMENTS.get(weakness, frozenset())
     
     def _calculate_tension_intensity(self, tension_type: TensionType, execution_mode: str) -> float:
         """Calculate appropriate tension intensity."""
@@ -604,165 +891,55 @@ class CreativeTensionPairing(BaseAgent):
     
     def _determine_synthesis_timing(self, tension_type: TensionType, execution_mode: str) -> str:
         """Determine when to synthesize tension outputs."""
-        
-        timing_strategies = {
-            TensionType.VISION_VS_EXECUTION: "after_exploration_phase",
-            TensionType.INNOVATION_VS_FEASIBILITY: "iterative_checkpoint",
-            TensionType.USER_VS_BUSINESS: "value_alignment_reached",
-            TensionType.CREATIVE_VS_STRATEGIC: "creative_options_generated",
-            TensionType.EXPLORATION_VS_OPTIMIZATION: "exploration_saturation",
-            TensionType.DEPTH_VS_BREADTH: "comprehensive_coverage_achieved",
-            TensionType.SPEED_VS_QUALITY: "quality_velocity_balance_found"
-        }
-        
-        return timing_strategies[tension_type]
+        return _SYNTHESIS_TIMING[tension_type]
     
-    def _set_breakthrough_thresholds(self, tension_type: TensionType) -> Dict[str, float]:
+    def _set_breakthrough_thresholds(self, tension_type: TensionType) -> Mapping[str, float]:
         """Set thresholds for identifying breakthroughs."""
-        
-        return {
-            "innovation_score": 0.8,
-            "synthesis_quality": 0.7,
-            "strategic_alignment": 0.8,
-            "creative_excellence": 0.7,
-            "feasibility_confidence": 0.6
-        }
+        return _BREAKTHROUGH_THRESHOLDS
     
-    def _set_intervention_triggers(self, tension_type: TensionType) -> List[str]:
+    def _set_intervention_triggers(self, tension_type: TensionType) -> Sequence[str]:
         """Set triggers for facilitation intervention."""
-        
-        return [
-            "unproductive_conflict_detected",
-            "synthesis_stagnation",
-            "breakthrough_opportunity_identified",
-            "tension_intensity_too_low",
-            "conflict_resolution_needed"
-        ]
+        return _INTERVENTION_TRIGGERS
     
-    def _define_productive_indicators(self, tension_type: TensionType) -> List[str]:
+    def _define_productive_indicators(self, tension_type: TensionType) -> Sequence[str]:
         """Define indicators of productive tension."""
-        
-        return [
-            "new_insights_generated",
-            "creative_solutions_emerging",
-            "quality_improvements_identified",
-            "strategic_clarity_increasing",
-            "breakthrough_patterns_visible"
-        ]
+        return _PRODUCTIVE_INDICATORS
     
-    def _define_warning_signs(self, tension_type: TensionType) -> List[str]:
+    def _define_warning_signs(self, tension_type: TensionType) -> Sequence[str]:
         """Define warning signs of unproductive conflict."""
-        
-        return [
-            "personal_conflict_emerging",
-            "circular_arguments",
-            "quality_degradation",
-            "stakeholder_confusion",
-            "synthesis_avoidance"
-        ]
+        return _WARNING_SIGNS
     
-    def _identify_breakthrough_indicators(self, tension_type: TensionType) -> List[str]:
+    def _identify_breakthrough_indicators(self, tension_type: TensionType) -> Sequence[str]:
         """Identify specific breakthrough indicators for tension type."""
-        
-        indicators = {
-            TensionType.VISION_VS_EXECUTION: [
-                "visionary_concepts_with_clear_implementation_path",
-                "practical_solutions_with_inspiring_vision",
-                "staged_realization_roadmap_clarity"
-            ],
-            TensionType.INNOVATION_VS_FEASIBILITY: [
-                "innovative_solutions_within_constraints",
-                "constraint_driven_creative_breakthroughs",
-                "feasible_paradigm_shifts"
-            ],
-            TensionType.USER_VS_BUSINESS: [
-                "win_win_value_propositions",
-                "user_delight_driving_business_success",
-                "business_model_innovation_benefiting_users"
-            ]
-        }
-        
-        return indicators.get(tension_type, ["creative_breakthrough_achieved", "strategic_innovation_identified"])
+        return _BREAKTHROUGH_INDICATORS_BY_TYPE.get(tension_type, _DEFAULT_BREAKTHROUGH_INDICATORS)
     
-    def _define_conflict_resolution(self, tension_type: TensionType) -> Dict[str, str]:
+    def _define_conflict_resolution(self, tension_type: TensionType) -> Mapping[str, str]:
         """Define conflict resolution approaches."""
-        
-        return {
-            "resolution_philosophy": "synthesis_over_compromise",
-            "intervention_style": "facilitative_guidance",
-            "breakthrough_catalyst": "reframe_tension_as_opportunity",
-            "synthesis_method": "creative_integration"
-        }
+        return _CONFLICT_RESOLUTION
     
     def _determine_facilitation_style(self, tension_type: TensionType) -> str:
         """Determine facilitation style for tension type."""
-        
-        styles = {
-            TensionType.VISION_VS_EXECUTION: "visionary_pragmatist",
-            TensionType.INNOVATION_VS_FEASIBILITY: "constraint_catalyst",
-            TensionType.USER_VS_BUSINESS: "value_alignment_facilitator",
-            TensionType.CREATIVE_VS_STRATEGIC: "purpose_driven_creativity",
-            TensionType.EXPLORATION_VS_OPTIMIZATION: "progressive_focusing",
-            TensionType.DEPTH_VS_BREADTH: "comprehensive_synthesis",
-            TensionType.SPEED_VS_QUALITY: "velocity_quality_optimizer"
-        }
-        
-        return styles[tension_type]
+        return _FACILITATION_STYLES[tension_type]
     
-    def _define_intervention_techniques(self, tension_type: TensionType) -> List[str]:
+    def _define_intervention_techniques(self, tension_type: TensionType) -> Sequence[str]:
         """Define intervention techniques for managing tension."""
-        
-        return [
-            "reframe_conflict_as_creative_opportunity",
-            "identify_shared_values_and_goals",
-            "facilitate_perspective_taking_exercises",
-            "guide_synthesis_thinking",
-            "catalyze_breakthrough_moments"
-        ]
+        return _INTERVENTION_TECHNIQUES
     
-    def _define_breakthrough_acceleration(self, tension_type: TensionType) -> List[str]:
+    def _define_breakthrough_acceleration(self, tension_type: TensionType) -> Sequence[str]:
         """Define techniques for accelerating breakthroughs."""
-        
-        return [
-            "amplify_productive_tension_patterns",
-            "introduce_synthesis_catalysts",
-            "facilitate_creative_leaps",
-            "connect_disparate_insights",
-            "enable_innovative_integration"
-        ]
+        return _BREAKTHROUGH_ACCELERATION
     
-    def _define_conflict_navigation(self, tension_type: TensionType) -> List[str]:
+    def _define_conflict_navigation(self, tension_type: TensionType) -> Sequence[str]:
         """Define conflict navigation techniques."""
-        
-        return [
-            "acknowledge_valid_perspectives",
-            "identify_underlying_needs_and_values",
-            "explore_creative_alternatives",
-            "facilitate_collaborative_problem_solving",
-            "guide_toward_synthesis_solutions"
-        ]
+        return _CONFLICT_NAVIGATION
     
-    def _define_synthesis_facilitation(self, tension_type: TensionType) -> List[str]:
+    def _define_synthesis_facilitation(self, tension_type: TensionType) -> Sequence[str]:
         """Define synthesis facilitation techniques."""
-        
-        return [
-            "pattern_recognition_and_integration",
-            "creative_combination_of_perspectives",
-            "strategic_alignment_of_solutions",
-            "innovative_resolution_development",
-            "breakthrough_insight_crystallization"
-        ]
+        return _SYNTHESIS_FACILITATION
     
-    def _define_success_amplification(self, tension_type: TensionType) -> List[str]:
+    def _define_success_amplification(self, tension_type: TensionType) -> Sequence[str]:
         """Define success amplification techniques."""
-        
-        return [
-            "recognize_and_celebrate_breakthroughs",
-            "document_successful_tension_patterns",
-            "share_insights_across_agent_network",
-            "refine_synthesis_approaches",
-            "build_creative_momentum"
-        ]
+        return _SUCCESS_AMPLIFICATION
     
     def _calculate_pairing_confidence(
         self, 
@@ -774,10 +951,22 @@ class CreativeTensionPairing(BaseAgent):
         if not agent_pairs:
             return 0.3
         
-        avg_tension_score = sum(pair["productive_tension_score"] for pair in agent_pairs) / len(agent_pairs)
-        context_clarity = 1.0 - tension_analysis.get("uncertainty", 0.2)
+        uncertainty = tension_analysis.get("uncertainty", 0.2)
+
+        # Compiled kernel when Numba is available; bulk pairing evaluation is
+        # dispatch-bound, not data-bound
+        if njit is not None:
+            scores = np.fromiter(
+                (pair["productive_tension_score"] for pair in agent_pairs),
+                dtype=np.float64,
+                count=len(agent_pairs)
+            )
+            return float(_agg_confidence(scores, uncertainty))
+
+        # fmean is C-implemented; one pass, no separate len/divide dispatch
+        avg_tension_score = fmean(pair["productive_tension_score"] for pair in agent_pairs)
         
-        return (avg_tension_score * 0.6) + (context_clarity * 0.4)
+        return (avg_tension_score * 0.6) + ((1.0 - uncertainty) * 0.4)
     
     def _identify_assumptions(self) -> List[str]:
         """Identify assumptions in creative tension pairing."""
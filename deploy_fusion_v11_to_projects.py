@@ -10,32 +10,148 @@ Usage:
 """
 
 import argparse
+import functools
+import io
 import json
+from dataclasses import dataclass, field
 import os
 import shutil
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
-# Import your foundation system
-try:
-    sys.path.append(os.path.join(os.path.dirname(__file__), "01_Core_Infrastructure"))
-    from fusion_v11_foundation import FusionV11Foundation, ProjectScaffolding
-except ImportError:
-    print("❌ Could not import fusion_v11_foundation. Make sure it's in your Python path.")
-    print("    Expected location: 01_Core_Infrastructure/fusion_v11_foundation.py")
-    sys.exit(1)
+# Loaded lazily by _load_foundation() so --help/--report runs don't pay
+# for the full Fusion stack at module import.
+_FOUNDATION = None
+
+
+def _load_foundation():
+    """Import the foundation system on first use and cache the classes."""
+    global _FOUNDATION
+    if _FOUNDATION is None:
+        sys.path.append(os.path.join(os.path.dirname(__file__), "01_Core_Infrastructure"))
+        try:
+            from fusion_v11_foundation import FusionV11Foundation, ProjectScaffolding
+        except ImportError:
+            print("❌ Could not import fusion_v11_foundation. Make sure it's in your Python path.")
+            print("    Expected location: 01_Core_Infrastructure/fusion_v11_foundation.py")
+            sys.exit(1)
+        _FOUNDATION = (FusionV11Foundation, ProjectScaffolding)
+    return _FOUNDATION
+
+
+# Sentinel substituted with the real project name when templates are written.
+_PROJECT_NAME_SENTINEL = "__PROJECT_NAME__"
+
+# Formatted once per project via format_map; doubled braces are literal
+# braces in the generated script.
+_UPGRADE_SCRIPT_TEMPLATE = '''"""
+Fusion v11 Upgrade Script for {project_name}
+Generated automatically by deployment system.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fusion_v11_foundation import FusionV11Foundation
+
+# Initialize foundation for this project
+foundation = FusionV11Foundation("{project_name}", "{project_type}")
+
+# Validate system health
+health = foundation.validate_system_health()
+print("System Health Check:")
+for check, status in health.items():
+    print(f"{{status}} {{check}}")
+
+# Get ChatGPT upload package
+upload_info = foundation.get_chatgpt_upload_package()
+print(f"\\n📁 ChatGPT Upload Package: {{upload_info['source_location']}}")
+print("Upload these 10 files to ChatGPT:")
+for file in upload_info['upload_sequence']:
+    print(f"✅ {{file}}")
+
+print("\\n🚀 {project_name} is now Fusion v11 ready!")
+'''
+
+
+@functools.lru_cache(maxsize=16)
+def _config_template_json(project_type: str) -> str:
+    """Serialize the v11 config once per project type.
+
+    Most of the config is project-name-independent boilerplate, so batch
+    deployments pay for one json.dumps per type instead of one per project.
+    """
+    foundation_cls, _ = _load_foundation()
+    foundation = foundation_cls(_PROJECT_NAME_SENTINEL, project_type)
+    return json.dumps(foundation.v11_config, indent=2)
+
+
+@functools.lru_cache(maxsize=16)
+def _setup_guide_template(project_type: str) -> str:
+    """Render the setup-guide markdown once per project type."""
+    foundation_cls, _ = _load_foundation()
+    foundation = foundation_cls(_PROJECT_NAME_SENTINEL, project_type)
+    return foundation.generate_project_report()
+
+
+def _reflink_copy(src, dst, *, follow_symlinks=True):
+    """Copy one file with os.copy_file_range when available.
+
+    On Linux (kernel >= 4.5) this lets CoW filesystems like Btrfs/XFS
+    reflink the data instead of block-copying it, so batch deployments
+    of the v11 bundle cost near-zero disk bandwidth. Falls back to
+    shutil.copy2 anywhere the fast path is unsupported.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(
+                        fsrc.fileno(), fdst.fileno(), remaining
+                    )
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+            return dst
+        except OSError:
+            pass  # e.g. cross-device copy; fall through to the slow path
+    return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+
+
+@dataclass(slots=True)
+class DeploymentRecord:
+    """One deployment outcome; slotted for low overhead at batch scale."""
+    project_name: str
+    project_type: str = "design_innovation"
+    deployment_type: str = "new_project"
+    status: str = "success"
+    health_check: Dict[str, Any] = field(default_factory=dict)
+    upload_package: Dict[str, Any] = field(default_factory=dict)
+    setup_report: Optional[str] = None
+    project_path: Optional[str] = None
+    files_created: List[str] = field(default_factory=list)
+    error: Optional[str] = None
 
 
 class FusionV11Deployer:
     """Deploy Fusion v11 to any project with complete automation."""
     
     def __init__(self):
-        self.source_v11_path = Path("01_Core_Infrastructure/Fusion_v11_Complete_10_Files")
+        # Resolve the bundle path once and cache the existence check; it
+        # is immutable during deployment, so this saves a stat per project.
+        self.source_v11_path = Path(__file__).parent / "01_Core_Infrastructure/Fusion_v11_Complete_10_Files"
+        self._source_exists = self.source_v11_path.is_dir()
         self.deployments_log = []
+        self._log_lock = threading.Lock()
         
-    def deploy_to_new_project(self, project_name: str, project_type: str = "design_innovation", 
-                             target_directory: Optional[str] = None) -> Dict[str, Any]:
+    def deploy_to_new_project(self, project_name: str, project_type: str = "design_innovation",
+                             target_directory: Optional[str] = None) -> DeploymentRecord:
         """Deploy Fusion v11 to a new project."""
         
         print(f"\n🚀 CREATING NEW PROJECT: {project_name}")
@@ -43,15 +159,13 @@ class FusionV11Deployer:
         print("-" * 50)
         
         try:
-            # Use target directory if provided, otherwise use default
-            if target_directory:
-                original_cwd = os.getcwd()
-                os.chdir(target_directory)
-            
-            # Create foundation
-            foundation = ProjectScaffolding.create_new_fusion_v11_project(
+            # Create foundation; pass the target explicitly instead of
+            # chdir-ing so parallel batch deploys stay thread-safe.
+            _, scaffolding_cls = _load_foundation()
+            foundation = scaffolding_cls.create_new_fusion_v11_project(
                 project_name=project_name,
-                project_type=project_type
+                project_type=project_type,
+                base_dir=Path(target_directory) if target_directory else Path.cwd()
             )
             
             # Validate system
@@ -64,32 +178,30 @@ class FusionV11Deployer:
             report = foundation.generate_project_report()
             
             # Log deployment
-            deployment_result = {
-                "project_name": project_name,
-                "project_type": project_type,
-                "deployment_type": "new_project",
-                "status": "success",
-                "health_check": health,
-                "upload_package": upload_info,
-                "setup_report": report
-            }
-            
-            self.deployments_log.append(deployment_result)
+            deployment_result = DeploymentRecord(
+                project_name=project_name,
+                project_type=project_type,
+                deployment_type="new_project",
+                health_check=health,
+                upload_package=upload_info,
+                setup_report=report
+            )
             
+            with self._log_lock:
+                self.deployments_log.append(deployment_result)
+
             print(f"✅ SUCCESS: {project_name} created with full Fusion v11 infrastructure")
             print(f"📁 Location: Projects/{project_name}")
             print(f"🤖 ChatGPT Package: {upload_info['source_location']}")
-            
-            if target_directory:
-                os.chdir(original_cwd)
-                
+
             return deployment_result
             
         except Exception as e:
             print(f"❌ ERROR: Failed to create {project_name}: {str(e)}")
-            return {"project_name": project_name, "status": "failed", "error": str(e)}
+            return DeploymentRecord(project_name=project_name, project_type=project_type,
+                                    status="failed", error=str(e))
     
-    def deploy_to_existing_project(self, project_path_str: str, project_type: str = "design_innovation") -> Dict[str, Any]:
+    def deploy_to_existing_project(self, project_path_str: str, project_type: str = "design_innovation") -> DeploymentRecord:
         """Deploy Fusion v11 to an existing project."""
         
         project_path = Path(project_path_str)
@@ -111,61 +223,40 @@ class FusionV11Deployer:
             
             # Copy Fusion v11 Complete 10 Files
             v11_target_path = core_infra_path / "Fusion_v11_Complete_10_Files"
-            if self.source_v11_path.exists():
-                shutil.copytree(self.source_v11_path, v11_target_path, dirs_exist_ok=True)
+            if self._source_exists:
+                shutil.copytree(self.source_v11_path, v11_target_path,
+                                copy_function=_reflink_copy, dirs_exist_ok=True)
                 print(f"✅ Copied Fusion v11 Complete system to {v11_target_path}")
             else:
                 print(f"⚠️  Warning: Source v11 files not found at {self.source_v11_path}")
             
             # Initialize foundation
-            foundation = FusionV11Foundation(project_name, project_type)
+            foundation_cls, _ = _load_foundation()
+            foundation = foundation_cls(project_name, project_type)
             
-            # Create project configuration
+            # Create project configuration from the cached per-type template
             config_path = project_path / "project_config.json"
-            with open(config_path, 'w') as f:
-                json.dump(foundation.v11_config, f, indent=2)
+            config_path.write_text(
+                _config_template_json(project_type).replace(
+                    _PROJECT_NAME_SENTINEL, project_name
+                )
+            )
             print(f"✅ Created configuration: {config_path}")
-            
-            # Generate setup guide
+
+            # Generate setup guide from the cached per-type template
             setup_guide_path = project_path / f"{project_name}_FUSION_V11_SETUP.md"
-            with open(setup_guide_path, 'w') as f:
-                f.write(foundation.generate_project_report())
+            setup_guide_path.write_text(
+                _setup_guide_template(project_type).replace(
+                    _PROJECT_NAME_SENTINEL, project_name
+                )
+            )
             print(f"✅ Created setup guide: {setup_guide_path}")
             
-            # Create upgrade script
+            # Create upgrade script from the module-level template
             upgrade_script_path = project_path / "fusion_v11_upgrade.py"
-            upgrade_script_content = f'''"""
-Fusion v11 Upgrade Script for {project_name}
-Generated automatically by deployment system.
-"""
-
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from fusion_v11_foundation import FusionV11Foundation
-
-# Initialize foundation for this project
-foundation = FusionV11Foundation("{project_name}", "{project_type}")
-
-# Validate system health
-health = foundation.validate_system_health()
-print("System Health Check:")
-for check, status in health.items():
-    print(f"{{status}} {{check}}")
-
-# Get ChatGPT upload package
-upload_info = foundation.get_chatgpt_upload_package()
-print(f"\\n📁 ChatGPT Upload Package: {{upload_info['source_location']}}")
-print("Upload these 10 files to ChatGPT:")
-for file in upload_info['upload_sequence']:
-    print(f"✅ {{file}}")
-
-print("\\n🚀 {project_name} is now Fusion v11 ready!")
-'''
-            
-            with open(upgrade_script_path, 'w') as f:
-                f.write(upgrade_script_content)
+            upgrade_script_path.write_text(_UPGRADE_SCRIPT_TEMPLATE.format_map(
+                {"project_name": project_name, "project_type": project_type}
+            ))
             print(f"✅ Created upgrade script: {upgrade_script_path}")
             
             # Validate system
@@ -173,23 +264,23 @@ print("\\n🚀 {project_name} is now Fusion v11 ready!")
             upload_info = foundation.get_chatgpt_upload_package()
             
             # Log deployment
-            deployment_result = {
-                "project_name": project_name,
-                "project_path": str(project_path),
-                "project_type": project_type,
-                "deployment_type": "existing_project",
-                "status": "success",
-                "health_check": health,
-                "upload_package": upload_info,
-                "files_created": [
+            deployment_result = DeploymentRecord(
+                project_name=project_name,
+                project_path=str(project_path),
+                project_type=project_type,
+                deployment_type="existing_project",
+                health_check=health,
+                upload_package=upload_info,
+                files_created=[
                     str(config_path),
                     str(setup_guide_path),
                     str(upgrade_script_path)
                 ]
-            }
-            
-            self.deployments_log.append(deployment_result)
+            )
             
+            with self._log_lock:
+                self.deployments_log.append(deployment_result)
+
             print(f"✅ SUCCESS: {project_name} upgraded to Fusion v11")
             print(f"🤖 ChatGPT Package: {upload_info['source_location']}")
             
@@ -197,45 +288,51 @@ print("\\n🚀 {project_name} is now Fusion v11 ready!")
             
         except Exception as e:
             print(f"❌ ERROR: Failed to upgrade {project_name}: {str(e)}")
-            return {"project_name": project_name, "status": "failed", "error": str(e)}
+            return DeploymentRecord(project_name=project_name, project_type=project_type,
+                                    deployment_type="existing_project",
+                                    status="failed", error=str(e))
     
-    def batch_deploy(self, projects_config: List[Dict[str, str]]) -> List[Dict[str, Any]]:
-        """Deploy Fusion v11 to multiple projects."""
-        
+    def _deploy_one(self, project: Dict[str, str]) -> DeploymentRecord:
+        """Dispatch a single batch entry to the right deployment path."""
+        if project.get("existing_path"):
+            # Existing project
+            return self.deploy_to_existing_project(
+                project["existing_path"],
+                project.get("type", "design_innovation")
+            )
+        # New project
+        return self.deploy_to_new_project(
+            project["name"],
+            project.get("type", "design_innovation"),
+            project.get("target_directory")
+        )
+
+    def batch_deploy(self, projects_config: List[Dict[str, str]]) -> List[DeploymentRecord]:
+        """Deploy Fusion v11 to multiple projects in parallel."""
+
         print(f"\n🚀 BATCH DEPLOYMENT: {len(projects_config)} PROJECTS")
         print("=" * 60)
-        
-        results = []
-        
-        for project in projects_config:
-            if project.get("existing_path"):
-                # Existing project
-                result = self.deploy_to_existing_project(
-                    project["existing_path"],
-                    project.get("type", "design_innovation")
-                )
-            else:
-                # New project
-                result = self.deploy_to_new_project(
-                    project["name"],
-                    project.get("type", "design_innovation"),
-                    project.get("target_directory")
-                )
-            
-            results.append(result)
-        
+
+        # Deployments are dominated by independent filesystem I/O, so run
+        # them on a thread pool; futures keep results in input order.
+        # `or 1` keeps an empty batch valid (max_workers must be > 0).
+        with ThreadPoolExecutor(max_workers=min(8, len(projects_config)) or 1) as executor:
+            futures = [executor.submit(self._deploy_one, project)
+                       for project in projects_config]
+            results = [future.result() for future in futures]
+
         # Summary
-        successful = [r for r in results if r.get("status") == "success"]
-        failed = [r for r in results if r.get("status") == "failed"]
-        
+        successful = [r for r in results if r.status == "success"]
+        failed = [r for r in results if r.status == "failed"]
+
         print(f"\n📊 BATCH DEPLOYMENT SUMMARY:")
         print(f"✅ Successful: {len(successful)}")
         print(f"❌ Failed: {len(failed)}")
-        
+
         if failed:
             print("\nFailed deployments:")
             for failure in failed:
-                print(f"❌ {failure['project_name']}: {failure.get('error', 'Unknown error')}")
+                print(f"❌ {failure.project_name}: {failure.error or 'Unknown error'}")
         
         return results
     
@@ -245,10 +342,15 @@ print("\\n🚀 {project_name} is now Fusion v11 ready!")
         if not self.deployments_log:
             return "No deployments recorded."
         
-        successful = [d for d in self.deployments_log if d.get("status") == "success"]
-        failed = [d for d in self.deployments_log if d.get("status") == "failed"]
+        successful = [d for d in self.deployments_log if d.status == "success"]
+        failed = [d for d in self.deployments_log if d.status == "failed"]
         
-        report = f"""
+        # Stream into a StringIO: += on a growing string reallocates the
+        # whole report per deployment, which is O(n^2) on large batches.
+        buf = io.StringIO()
+        write = buf.write
+
+        write(f"""
 # 🚀 FUSION V11 DEPLOYMENT REPORT
 
 ## 📊 DEPLOYMENT SUMMARY
@@ -258,30 +360,30 @@ print("\\n🚀 {project_name} is now Fusion v11 ready!")
 - **Success Rate**: {len(successful)/len(self.deployments_log)*100:.1f}%
 
 ## ✅ SUCCESSFUL DEPLOYMENTS
-"""
-        
+""")
+
         for deployment in successful:
-            report += f"""
-### {deployment['project_name']}
-- **Type**: {deployment['project_type']}
-- **Deployment**: {deployment['deployment_type']}
-- **Status**: {deployment['status']}
-- **System Health**: {deployment['health_check']['system_readiness']}
-- **ChatGPT Package**: {deployment['upload_package']['source_location']}
-"""
-        
+            write(f"""
+### {deployment.project_name}
+- **Type**: {deployment.project_type}
+- **Deployment**: {deployment.deployment_type}
+- **Status**: {deployment.status}
+- **System Health**: {deployment.health_check['system_readiness']}
+- **ChatGPT Package**: {deployment.upload_package['source_location']}
+""")
+
         if failed:
-            report += f"""
+            write("""
 
 ## ❌ FAILED DEPLOYMENTS
-"""
+""")
             for failure in failed:
-                report += f"""
-### {failure['project_name']}
-- **Error**: {failure.get('error', 'Unknown error')}
-"""
-        
-        report += f"""
+                write(f"""
+### {failure.project_name}
+- **Error**: {failure.error or 'Unknown error'}
+""")
+
+        write("""
 
 ## 🎯 NEXT STEPS
 1. **Upload to ChatGPT**: Each project has 10-file package ready
@@ -296,9 +398,9 @@ print("\\n🚀 {project_name} is now Fusion v11 ready!")
 - **Production Ready**: Professional-grade quality assurance
 
 **All projects now operate at Fusion v11 excellence standards!**
-"""
-        
-        return report
+""")
+
+        return buf.getvalue()
 
 
 def main():
@@ -371,9 +473,8 @@ def main():
         report = deployer.generate_deployment_report()
         
         report_file = "fusion_v11_deployment_report.md"
-        with open(report_file, 'w') as f:
-            f.write(report)
-        
+        Path(report_file).write_text(report)
+
         print(f"\n📄 Deployment report saved: {report_file}")
         print("\n" + "=" * 60)
         print("🎯 FUSION V11 DEPLOYMENT COMPLETE")
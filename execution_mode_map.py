@@ -7,6 +7,9 @@ class ExecutionMode(Enum):
     SHIP = "ship"
     CRITIQUE = "critique"
 
+# Dict lookup is ~10x cheaper than ExecutionMode(value) validation
+EXECUTION_MODE_BY_NAME: Dict[str, ExecutionMode] = {mode.value: mode for mode in ExecutionMode}
+
 @dataclass
 class ModeConfig:
     """Configuration for an execution mode"""
@@ -95,19 +98,19 @@ EXECUTION_MODE_BEHAVIOR: Dict[str, ModeConfig] = {
     )
 }
 
+# Shared default for unknown modes; built once instead of per lookup
+DEFAULT_MODE_CONFIG = ModeConfig(
+    tone="balanced",
+    innovation_weight=1.0,
+    clarity_weight=1.0,
+    critique_threshold=0.7,
+    pattern_modifiers={},
+    agent_modifiers={}
+)
+
 def get_mode_config(mode: str) -> ModeConfig:
     """Get configuration for execution mode"""
-    if mode not in EXECUTION_MODE_BEHAVIOR:
-        # Return default mode config
-        return ModeConfig(
-            tone="balanced",
-            innovation_weight=1.0,
-            clarity_weight=1.0,
-            critique_threshold=0.7,
-            pattern_modifiers={},
-            agent_modifiers={}
-        )
-    return EXECUTION_MODE_BEHAVIOR[mode]
+    return EXECUTION_MODE_BEHAVIOR.get(mode, DEFAULT_MODE_CONFIG)
 
 def apply_mode_to_agent(
     agent_name: str,
@@ -5,35 +5,52 @@ Enables command-line access to agents, chains, and evaluation.
 """
 
 import argparse
+import functools
 import json
+import os
 import sys
 from pathlib import Path
 
-from agent_chain import AgentChain
+try:
+    import orjson  # 3-10x faster JSON; optional, stdlib fallback below
+except ImportError:
+    orjson = None
 
-def main():
+def _dumps_bytes(obj) -> bytes:
+    """Serialize to pretty-printed JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, default=str).encode()
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once per process"""
     parser = argparse.ArgumentParser(description="Fusion Debug Mode")
-    parser.add_argument("--input", required=True,
+    parser.add_argument("--input", required=True, type=argparse.FileType('rb'),
                       help="Input text file")
-    parser.add_argument("--config", required=True,
+    parser.add_argument("--config", required=True, type=argparse.FileType('rb'),
                       help="Chain configuration file")
     parser.add_argument("--output",
                       help="Output JSON file")
     parser.add_argument("--no-adaptive", action="store_true",
                       help="Disable adaptive pattern switching")
-    args = parser.parse_args()
+    return parser
+
+def main():
+    args = _build_parser().parse_args()
     
     try:
-        # Load input
-        with open(args.input, 'r') as f:
-            input_text = f.read()
-            
-        # Load config
-        with open(args.config, 'r') as f:
-            chain_config = json.load(f)
+        # argparse already validated and opened both files; read and close
+        with args.input as f:
+            input_text = f.read().decode('utf-8')
+        with args.config as f:
+            raw_config = f.read()
+        chain_config = orjson.loads(raw_config) if orjson is not None else json.loads(raw_config)
             
-        # Create and run chain
-        chain = AgentChain(args.config)
+        # Create and run chain from the already-parsed config; imported
+        # here so --help and bad-args paths skip loading the agent stack
+        from agent_chain import AgentChain
+        chain = AgentChain.from_config(chain_config)
         result = chain.execute(
             input_text=input_text,
             adaptive=not args.no_adaptive
@@ -41,8 +58,11 @@ def main():
         
         # Save or print output
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(result, f, indent=2)
+            # One pre-encoded write, then an atomic rename so a crash
+            # can't leave a half-written result
+            tmp = f"{args.output}.tmp"
+            Path(tmp).write_bytes(_dumps_bytes(result))
+            os.replace(tmp, args.output)
         else:
             print("\nOutput:")
             print(result["output"])
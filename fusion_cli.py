@@ -1,44 +1,94 @@
 #!/usr/bin/env python3
 import argparse
+import functools
+import io
 import json
+import re
 import sys
 import os
 from datetime import datetime
 from typing import Dict, Optional, List
 from pathlib import Path
 
-from agent_chain import AgentChain
-from execution_mode_map import ExecutionMode, get_mode_config
-from input_transformer import transform_output_to_input
-from prompt_pattern_registry import get_pattern_by_name
+from execution_mode_map import EXECUTION_MODE_BY_NAME
+
 
 FUSION_TODO_DIR = Path("_fusion_todo")
 CHAIN_TEMPLATES_DIR = FUSION_TODO_DIR / "chain_templates"
 CHAIN_RUN_LOGS_DIR = FUSION_TODO_DIR / "chain_run_logs"
 
+try:
+    import orjson  # C-accelerated JSON; optional, stdlib fallback below
+except ImportError:
+    orjson = None
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, via orjson when available"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _json_dumps_bytes(obj) -> bytes:
+    """Serialize to indented JSON bytes, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+def _write_atomic(path, data: bytes):
+    """Write bytes to a temp file, then atomically replace the target"""
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+@functools.lru_cache(maxsize=32)
+def _read_cached(path: str, mtime_ns: int, size: int) -> str:
+    # Binary read + one decode skips text-mode newline translation
+    return Path(path).read_bytes().decode('utf-8')
+
 def load_input(input_path: str) -> str:
-    """Load input text"""
-    with open(input_path, 'r') as f:
-        return f.read()
+    """Load input text, cached by (path, mtime, size) across invocations"""
+    st = os.stat(input_path)
+    return _read_cached(os.path.abspath(input_path), st.st_mtime_ns, st.st_size)
+
+# Default chain steps; shared tuple so the fallback config costs one
+# small dict per invocation instead of rebuilding the nested literals.
+_DEFAULT_CHAIN = (
+    {"agent": "StrategyPilot", "pattern": "StepwiseInsightSynthesis"},
+    {"agent": "NarrativeArchitect", "pattern": "RoleDirective"},
+    {"agent": "EvaluatorAgent", "pattern": "PatternCritiqueThenRewrite"},
+)
+
+_EXEC_MODE_RE = re.compile(rb'("execution_mode"\s*:\s*)"[^"]*"')
+
+def patch_execution_mode(raw: bytes, mode: str) -> bytes:
+    """Splice execution_mode into raw config bytes without re-serializing"""
+    patched, count = _EXEC_MODE_RE.subn(rb'\1"' + mode.encode() + b'"', raw, count=1)
+    if count:
+        return patched
+    # No existing key: insert one after the opening brace
+    brace = raw.find(b"{")
+    if brace != -1:
+        return raw[:brace + 1] + b'"execution_mode": "' + mode.encode() + b'", ' + raw[brace + 1:]
+    return raw
 
 def load_chain_config(config_path: str) -> dict:
     """Load chain configuration"""
-    with open(config_path, 'r') as f:
-        return json.load(f)
+    return _json_loads(Path(config_path).read_bytes())
 
 def save_chain_config(config: dict) -> str:
     """Save chain configuration"""
+    return save_chain_config_bytes(_json_dumps_bytes(config))
+
+def save_chain_config_bytes(raw: bytes) -> str:
+    """Save pre-encoded chain configuration bytes"""
     os.makedirs(FUSION_TODO_DIR, exist_ok=True)
     path = FUSION_TODO_DIR / "chain_config.json"
-    with open(path, 'w') as f:
-        json.dump(config, f, indent=2)
+    _write_atomic(path, raw)
     return str(path)
 
 def save_output(result: dict, output_path: Optional[str] = None):
     """Save chain output"""
     if output_path:
-        with open(output_path, 'w') as f:
-            json.dump(result, f, indent=2)
+        _write_atomic(output_path, _json_dumps_bytes(result))
     else:
         print("\nOutput:")
         print(result["output"])
@@ -59,35 +109,38 @@ def log_chain_execution(config: dict, result: dict):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     path = FUSION_TODO_DIR / "chain_run_logs" / f"{timestamp}.md"
     
-    log = [
-        "# Chain Execution Log\n",
-        f"Time: {datetime.now().isoformat()}",
-        f"Mode: {config['execution_mode']}\n",
-        "## Configuration\n```json",
-        json.dumps(config, indent=2),
-        "```\n",
-        "## Output\n",
-        result["output"],
-        "\n## Metrics\n",
-        *[f"- {k}: {v:.2f}" if isinstance(v, (int, float)) else f"- {k}: {v}"
-          for k, v in result["metrics"].items()],
-        "\n## Reasoning Trail\n",
-        *[f"### Step {step['step']}: {step['agent']}"
-          f"\nPattern: {step['pattern']}"
-          f"\nMetrics: {', '.join(f'{k}={v:.2f}' if isinstance(v, (int, float)) else f'{k}={v}' for k, v in step['metrics'].items())}"
-          f"\nOutput: {step['output_preview']}"
-          for step in result["reasoning_trail"]]
-    ]
-    
+    # Stream into a StringIO so long reasoning trails avoid building and
+    # joining a large intermediate list.
+    buf = io.StringIO()
+    write = buf.write
+    write("# Chain Execution Log\n\n")
+    write(f"Time: {datetime.now().isoformat()}\n")
+    write(f"Mode: {config['execution_mode']}\n\n")
+    write("## Configuration\n```json\n")
+    write(_json_dumps_bytes(config).decode())
+    write("\n```\n\n")
+    write("## Output\n\n")
+    write(result["output"])
+    write("\n\n## Metrics\n\n")
+    for k, v in result["metrics"].items():
+        write(f"- {k}: {format(v, '.2f') if isinstance(v, (int, float)) else v}\n")
+    write("\n## Reasoning Trail\n\n")
+    for step in result["reasoning_trail"]:
+        metrics = ', '.join(
+            f"{k}={format(v, '.2f') if isinstance(v, (int, float)) else v}"
+            for k, v in step['metrics'].items()
+        )
+        write(f"### Step {step['step']}: {step['agent']}\n"
+              f"Pattern: {step['pattern']}\n"
+              f"Metrics: {metrics}\n"
+              f"Output: {step['output_preview']}\n")
+
     if result.get("fallbacks"):
-        log.extend([
-            "\n## Fallbacks\n",
-            *[f"- {f['agent']} -> {f['fallback_pattern']} ({f['reason']})"
-              for f in result["fallbacks"]]
-        ])
-    
-    with open(path, 'w') as f:
-        f.write("\n".join(log))
+        write("\n## Fallbacks\n\n")
+        for f in result["fallbacks"]:
+            write(f"- {f['agent']} -> {f['fallback_pattern']} ({f['reason']})\n")
+
+    path.write_text(buf.getvalue())
 
 def run_chain_from_template(
     template_name: str,
@@ -98,19 +151,21 @@ def run_chain_from_template(
     """Run chain from template"""
     # Load template
     template_path = CHAIN_TEMPLATES_DIR / f"{template_name}.json"
-    if not template_path.exists():
+    try:
+        template = load_chain_config(str(template_path))
+    except FileNotFoundError:
         raise ValueError(f"Template not found: {template_name}")
-        
-    template = load_chain_config(str(template_path))
     
     # Override mode
     template["execution_mode"] = mode
     
-    # Save config
-    config_path = save_chain_config(template)
-    
-    # Create and run chain
-    chain = AgentChain(config_path)
+    # Save config for the run record; the chain uses the in-memory dict
+    save_chain_config(template)
+
+    # Create and run chain; imported here so --help and argparse errors
+    # skip loading the agent stack
+    from agent_chain import AgentChain
+    chain = AgentChain.from_config(template)
     result = chain.execute(input_text=input_text, adaptive=adaptive)
     
     # Log execution
@@ -118,21 +173,29 @@ def run_chain_from_template(
     
     return result
 
-def main():
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once per process"""
     parser = argparse.ArgumentParser(description="Fusion CLI")
-    parser.add_argument("mode", choices=["simulate", "ship", "critique"],
+    parser.add_argument("mode", choices=sorted(EXECUTION_MODE_BY_NAME),
                       help="Execution mode")
     parser.add_argument("-i", "--input", required=True,
                       help="Input text file")
     parser.add_argument("-o", "--output",
                       help="Output JSON file")
-    parser.add_argument("-c", "--chain",
+    # Mutually exclusive at parse time: rejecting both before any work
+    # beats silently letting --template win after loading the agent stack
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("-c", "--chain",
                       help="Chain configuration file")
-    parser.add_argument("-t", "--template",
+    source.add_argument("-t", "--template",
                       help="Chain template name")
     parser.add_argument("--no-adaptive", action="store_true",
                       help="Disable adaptive pattern switching")
-    args = parser.parse_args()
+    return parser
+
+def main():
+    args = _build_parser().parse_args()
     
     try:
         # Load input
@@ -149,31 +212,23 @@ def main():
         else:
             # Load chain config
             if args.chain:
-                chain_config = load_chain_config(args.chain)
-                chain_config["execution_mode"] = args.mode
+                # Patch the mode into the raw bytes: one parse, no
+                # re-serialize of the nested chain list
+                raw = patch_execution_mode(Path(args.chain).read_bytes(), args.mode)
+                save_chain_config_bytes(raw)
+                chain_config = _json_loads(raw)
             else:
                 # Use default config
                 chain_config = {
                     "execution_mode": args.mode,
-                    "chain": [
-                        {
-                            "agent": "StrategyPilot",
-                            "pattern": "StepwiseInsightSynthesis"
-                        },
-                        {
-                            "agent": "NarrativeArchitect",
-                            "pattern": "RoleDirective"
-                        },
-                        {
-                            "agent": "EvaluatorAgent",
-                            "pattern": "PatternCritiqueThenRewrite"
-                        }
-                    ]
+                    "chain": list(_DEFAULT_CHAIN)
                 }
-            
-            # Save config and create chain
-            config_path = save_chain_config(chain_config)
-            chain = AgentChain(config_path)
+                save_chain_config(chain_config)
+
+            # Create chain from the in-memory config; the saved copy is
+            # just the run record
+            from agent_chain import AgentChain
+            chain = AgentChain.from_config(chain_config)
             
             # Execute chain
             result = chain.execute(
@@ -710,11 +710,28 @@ def calculate_design_craft_metrics(agent_output: Dict[str, Any]) -> Dict[str, An
         "business_impact": 0.86   # Calculated based on business value potential
     }
 
+# Shared Dispatcher: building the routing map and contracts per call is
+# pure fixed cost, so reuse one instance per process.
+_DISPATCHER: Optional[Dispatcher] = None
+
+def get_dispatcher() -> Dispatcher:
+    """Return the shared Dispatcher instance, created on first use."""
+    global _DISPATCHER
+    if _DISPATCHER is None:
+        _DISPATCHER = Dispatcher()
+    return _DISPATCHER
+
+def _reset_dispatcher():
+    """Discard the shared Dispatcher (for test isolation)."""
+    global _DISPATCHER
+    _DISPATCHER = None
+
 # Export all agents for use in the system
 __all__ = [
     "BaseAgent",
-    "PromptEngineer", 
+    "PromptEngineer",
     "Dispatcher",
     "TrustOrchestrator",
+    "get_dispatcher",
     "enhance_agent_output_with_v11_systems"
-] 
\ No newline at end of file
+]
\ No newline at end of file
@@ -4,19 +4,107 @@ Fusion v11 Monitoring System
 Integrates v10 monitoring capabilities with v11 enhancements
 """
 
+import atexit
+import heapq
+import operator
 import os
 import sys
 import time
 import json
-import psutil
-import subprocess
-from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import threading
-from dataclasses import dataclass, asdict
+from collections import deque
+from dataclasses import dataclass
+from statistics import fmean
 
-@dataclass
+try:
+    import orjson  # C-accelerated JSON; optional, stdlib fallback below
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _avg(a):
+    """Mean of a 1-D float64 array; JIT-compiled when numba is present."""
+    s = 0.0
+    for i in range(a.size):
+        s += a[i]
+    return s / a.size
+
+
+if njit is not None:
+    # LLVM-compiled reduction; cache=True keeps the one-off compile off
+    # warm starts, and the explicit signature avoids per-dtype recompiles
+    _avg = njit("float64(float64[:])", cache=True, fastmath=True)(_avg)
+
+
+def _mean(values) -> float:
+    """Average an iterable of floats through the fastest available path."""
+    if np is not None:
+        return float(_avg(np.fromiter(values, dtype=np.float64)))
+    return fmean(values)
+
+
+def pre_compile():
+    """Warm the JIT-compiled kernels ahead of first real use.
+
+    Callers that benchmark or tight-loop the aggregation paths (tests,
+    the monitoring loop itself) can invoke this once so numba's one-off
+    compile cost lands here instead of polluting the first measurement.
+    No-op without numpy/numba.
+    """
+    if np is None or njit is None:
+        return
+    for size in (1, 64):
+        _avg(np.ones(size, dtype=np.float64))
+
+# Rewrite the full summary file once per this many ticks; per-tick history
+# goes to the append-only event log instead, so steady-state write volume
+# is proportional to new events rather than total history.
+COMPACT_EVERY_TICKS = 12
+
+# Event lines are queued in memory and flushed together, so I/O submission
+# cost is paid once per batch rather than once per event.
+EVENT_BATCH_SIZE = 16
+EVENT_FLUSH_SECONDS = 60.0
+
+# Bounds for in-memory history; dashboards only read the recent tail, and
+# the full stream is already in the event log, so capping these keeps
+# memory and summary-file serialization cost constant over long runs.
+HEALTH_HISTORY_MAXLEN = 2880  # 24h of 30s ticks
+ALERT_HISTORY_MAXLEN = 1000
+DESIGN_CRAFT_MAXLEN = 10000
+
+# Disk usage moves slowly relative to the check interval; re-stat the
+# filesystem at most this often and serve the cached percent in between.
+DISK_USAGE_TTL_SECONDS = 60.0
+
+# System-level alert rules: (SystemHealth attribute / threshold key,
+# comparator, alert type, severity, message template). check_for_alerts
+# walks this table instead of hand-coded branches, so adding a rule is
+# one line.
+_ALERT_SPECS = (
+    ("cpu_usage", operator.gt, "high_cpu_usage", "warning",
+     "CPU usage at {:.1f}%"),
+    ("memory_usage", operator.gt, "high_memory_usage", "warning",
+     "Memory usage at {:.1f}%"),
+    ("trust_calibration_quality", operator.lt, "low_trust_calibration", "critical",
+     "Trust calibration quality at {:.2f}"),
+    ("bias_detection_accuracy", operator.lt, "low_bias_detection", "critical",
+     "Bias detection accuracy at {:.2f}"),
+)
+
+@dataclass(slots=True)
 class SystemHealth:
     """System health metrics."""
     cpu_usage: float
@@ -28,7 +116,7 @@ class SystemHealth:
     overall_health_score: float
     timestamp: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentMetrics:
     """Individual agent performance metrics."""
     agent_id: str
@@ -47,31 +135,104 @@ class FusionV11Monitor:
         self.workspace_path = workspace_path or os.getcwd()
         self.data_file = os.path.join(self.workspace_path, "fusion_v11_monitor_data.json")
         self.config_file = os.path.join(self.workspace_path, "fusion_v11_monitor_config.json")
-        
-        # Load or create monitoring data
+        self.events_file = os.path.join(self.workspace_path, "fusion_v11_monitor_events.ndjson")
+
+        # Append-only NDJSON event log; snapshots/alerts/suggestions are
+        # appended here per tick instead of rewriting the summary file.
+        # Pre-serialized lines queue in a bounded deque and flush in
+        # batches straight to an O_APPEND fd -- the kernel guarantees
+        # atomic appends, so the buffered-writer layer buys nothing here.
+        # The fd opens lazily on first flush so merely constructing a
+        # monitor never creates the file.
+        self._events_fd = None
+        # Interval bookkeeping runs on the monotonic clock: immune to NTP
+        # jumps and wall-clock adjustments. Wall time is only used for the
+        # timestamps that end up in records and on the dashboard.
+        self._pending_events = deque(maxlen=64)
+        self._last_event_flush = time.monotonic()
+        self._ticks_since_save = 0
+        self._disk_cache = (-DISK_USAGE_TTL_SECONDS, 0.0)  # (monotonic checked_at, percent)
+        
+        # Load or create monitoring data; bound the growing lists so old
+        # entries age out instead of accumulating forever
         self.monitoring_data = self._load_monitoring_data()
+        self.monitoring_data["alerts"] = deque(
+            self.monitoring_data["alerts"], maxlen=ALERT_HISTORY_MAXLEN)
+        self.monitoring_data["improvements_suggested"] = deque(
+            self.monitoring_data["improvements_suggested"], maxlen=ALERT_HISTORY_MAXLEN)
         self.config = self._load_config()
-        
-        # Agent performance tracking
+
+        # Agent performance tracking. Alongside the id -> AgentMetrics
+        # dict, keep a structure-of-arrays mirror: one contiguous column
+        # per numeric field plus an id -> row map, so the hot reductions
+        # walk flat lists instead of chasing per-object attributes.
         self.agent_metrics = {}
-        self.system_health_history = []
-        
-        # V11 specific monitoring
+        self._agent_rows = {}
+        self._row_agents = []  # row -> agent_id, inverse of _agent_rows
+        self._metric_columns = {
+            "response_time_ms": [],
+            "quality_score": [],
+            "trust_score": [],
+            "bias_score": []
+        }
+        # Running per-field sums maintained on update, so the dashboard
+        # averages are one division instead of a walk over all agents
+        self._metric_sums = dict.fromkeys(self._metric_columns, 0.0)
+        # One reusable SystemHealth instance is mutated per tick instead
+        # of allocating a fresh one; the dashboard only ever needs the
+        # latest snapshot plus the recent overall scores for the trend,
+        # so history keeps bare floats rather than objects.
+        self._health_scratch = SystemHealth(0.0, 0.0, 0.0, {}, 0.0, 0.0, 0.0, 0.0)
+        self._latest_health = None
+        self._health_score_history = deque(maxlen=HEALTH_HISTORY_MAXLEN)
+        
+        # V11 specific monitoring. Design craft scores are an append-only
+        # (timestamp, scores) deque -- float dict keys bought nothing and
+        # risked same-tick collisions -- with running sum/count kept
+        # alongside so the average is O(1) at render time.
         self.execution_mode_metrics = {}
         self.personality_overlay_metrics = {}
         self.creative_tension_metrics = {}
-        self.design_craft_metrics = {}
+        self.design_craft_metrics = deque(maxlen=DESIGN_CRAFT_MAXLEN)
+        self._design_craft_sum = 0.0
+        self._design_craft_count = 0
         
-        # Monitoring thread
+        # Monitoring thread; the stop event doubles as the inter-tick
+        # wait so shutdown interrupts the sleep instead of riding it out
         self.monitoring_active = False
         self.monitoring_thread = None
+        self._stop_event = threading.Event()
+
+    def reset(self):
+        """Clear collected metrics in place, keeping files and config.
+
+        Lets a long-lived monitor (or a shared test fixture) start from
+        a clean slate without paying construction cost again; the
+        containers are cleared rather than reallocated.
+        """
+        self.agent_metrics.clear()
+        self._agent_rows.clear()
+        self._row_agents.clear()
+        for column in self._metric_columns.values():
+            column.clear()
+        for field in self._metric_sums:
+            self._metric_sums[field] = 0.0
+        self._latest_health = None
+        self._health_score_history.clear()
+        self.execution_mode_metrics.clear()
+        self.personality_overlay_metrics.clear()
+        self.creative_tension_metrics.clear()
+        self.design_craft_metrics.clear()
+        self._design_craft_sum = 0.0
+        self._design_craft_count = 0
     
     def _load_monitoring_data(self) -> Dict[str, Any]:
         """Load existing monitoring data or create new."""
         if os.path.exists(self.data_file):
             try:
-                with open(self.data_file, 'r') as f:
-                    return json.load(f)
+                with open(self.data_file, 'rb') as f:
+                    raw = f.read()
+                return orjson.loads(raw) if orjson is not None else json.loads(raw)
             except:
                 pass
         
@@ -131,6 +292,11 @@ class FusionV11Monitor:
         """Start continuous monitoring."""
         if not self.monitoring_active:
             self.monitoring_active = True
+            self._stop_event.clear()
+            # Prime the non-blocking CPU sampler; subsequent calls return
+            # the usage since this baseline
+            import psutil
+            psutil.cpu_percent(interval=None)
             self.monitoring_thread = threading.Thread(target=self._monitoring_loop)
             self.monitoring_thread.daemon = True
             self.monitoring_thread.start()
@@ -139,8 +305,10 @@ class FusionV11Monitor:
     def stop_monitoring(self):
         """Stop continuous monitoring."""
         self.monitoring_active = False
+        self._stop_event.set()
         if self.monitoring_thread:
             self.monitoring_thread.join()
+        self._save_data()
         print("⏹️  Fusion v11 monitoring stopped")
     
     def _monitoring_loop(self):
@@ -152,36 +320,62 @@ class FusionV11Monitor:
                 agent_metrics = self.collect_agent_metrics()
                 v11_metrics = self.collect_v11_enhancement_metrics()
                 
-                # Store metrics
-                self.system_health_history.append(system_health)
-                self.monitoring_data["system_health_snapshots"].append(asdict(system_health))
-                
+                # Store metrics; snapshots go to the event log, not the
+                # ever-growing summary dict
+                self._health_score_history.append(system_health.overall_health_score)
+                self._append_event("snapshot", self._health_payload(system_health))
+
                 # Check for alerts
                 alerts = self.check_for_alerts(system_health, agent_metrics)
                 if alerts:
                     self.monitoring_data["alerts"].extend(alerts)
-                
+                    for alert in alerts:
+                        self._append_event("alert", alert)
+
                 # Generate suggestions
                 suggestions = self.generate_optimization_suggestions(system_health, agent_metrics, v11_metrics)
                 if suggestions:
                     self.monitoring_data["improvements_suggested"].extend(suggestions)
+                    for suggestion in suggestions:
+                        self._append_event("suggestion", suggestion)
+
+                # Compact the summary file occasionally; the event log
+                # already has everything up to this tick
+                self._ticks_since_save += 1
+                if self._ticks_since_save >= COMPACT_EVERY_TICKS:
+                    self._save_data()
                 
-                # Save data
-                self._save_data()
-                
-                # Wait for next check
-                time.sleep(self.config["check_interval_seconds"])
-                
+                # Wait for next check; returns early (True) on stop
+                if self._stop_event.wait(timeout=self.config["check_interval_seconds"]):
+                    break
+
             except Exception as e:
                 print(f"⚠️  Monitoring error: {e}")
-                time.sleep(60)  # Wait 1 minute before retrying
+                if self._stop_event.wait(timeout=60):  # Wait 1 minute before retrying
+                    break
     
     def collect_system_health(self) -> SystemHealth:
-        """Collect comprehensive system health metrics."""
-        # Basic system metrics
-        cpu_usage = psutil.cpu_percent(interval=1)
+        """Collect comprehensive system health metrics.
+
+        Returns a shared scratch instance that is overwritten on the
+        next call; serialize or copy it rather than caching a reference.
+        """
+        # Imported lazily (and cached in sys.modules) so constructing a
+        # monitor without starting it skips psutil's procfs setup cost
+        import psutil
+
+        # Basic system metrics; interval=None returns usage since the
+        # previous call instead of sleeping a full second inside the tick
+        cpu_usage = psutil.cpu_percent(interval=None)
         memory_usage = psutil.virtual_memory().percent
-        disk_usage = psutil.disk_usage('/').percent
+
+        # Disk capacity barely changes between ticks; serve the cached
+        # percent until the TTL lapses
+        now = time.monotonic()
+        checked_at, disk_usage = self._disk_cache
+        if now - checked_at >= DISK_USAGE_TTL_SECONDS:
+            disk_usage = psutil.disk_usage('/').percent
+            self._disk_cache = (now, disk_usage)
         
         # Agent performance summary
         agent_performance = {}
@@ -200,18 +394,21 @@ class FusionV11Monitor:
             trust_calibration_quality,
             bias_detection_accuracy
         ]
-        overall_health_score = sum(health_components) / len(health_components)
-        
-        return SystemHealth(
-            cpu_usage=cpu_usage,
-            memory_usage=memory_usage,
-            disk_usage=disk_usage,
-            agent_performance=agent_performance,
-            trust_calibration_quality=trust_calibration_quality,
-            bias_detection_accuracy=bias_detection_accuracy,
-            overall_health_score=overall_health_score,
-            timestamp=time.time()
-        )
+        overall_health_score = _mean(health_components)
+        
+        # Mutate the reusable scratch instance in place: no per-tick
+        # dataclass allocation
+        health = self._health_scratch
+        health.cpu_usage = cpu_usage
+        health.memory_usage = memory_usage
+        health.disk_usage = disk_usage
+        health.agent_performance = agent_performance
+        health.trust_calibration_quality = trust_calibration_quality
+        health.bias_detection_accuracy = bias_detection_accuracy
+        health.overall_health_score = overall_health_score
+        health.timestamp = time.time()
+        self._latest_health = health
+        return health
     
     def collect_agent_metrics(self) -> Dict[str, AgentMetrics]:
         """Collect individual agent performance metrics."""
@@ -243,6 +440,28 @@ class FusionV11Monitor:
             bias_score=bias_score,
             last_updated=time.time()
         )
+
+        # Keep the column mirror and running sums in step: subtract the
+        # agent's previous values (still in the columns) before the store
+        columns = self._metric_columns
+        sums = self._metric_sums
+        row = self._agent_rows.get(agent_id)
+        if row is None:
+            row = self._agent_rows[agent_id] = len(self._agent_rows)
+            self._row_agents.append(agent_id)
+            for column in columns.values():
+                column.append(0.0)
+        else:
+            for field, column in columns.items():
+                sums[field] -= column[row]
+        columns["response_time_ms"][row] = response_time_ms
+        columns["quality_score"][row] = quality_score
+        columns["trust_score"][row] = trust_score
+        columns["bias_score"][row] = bias_score
+        sums["response_time_ms"] += response_time_ms
+        sums["quality_score"] += quality_score
+        sums["trust_score"] += trust_score
+        sums["bias_score"] += bias_score
     
     def update_v11_metrics(self, execution_mode: str, personality_overlay: Optional[str] = None,
                           creative_tension: Optional[str] = None, design_craft_scores: Optional[Dict[str, float]] = None):
@@ -264,59 +483,50 @@ class FusionV11Monitor:
                 self.creative_tension_metrics[creative_tension] = {"count": 0, "avg_balance": 0.0}
             self.creative_tension_metrics[creative_tension]["count"] += 1
         
-        # Track design craft scores
+        # Track design craft scores, adjusting the running aggregate for
+        # any entry the bounded deque is about to evict
         if design_craft_scores:
-            self.design_craft_metrics[time.time()] = design_craft_scores
+            if len(self.design_craft_metrics) == self.design_craft_metrics.maxlen:
+                _, evicted = self.design_craft_metrics[0]
+                self._design_craft_sum -= sum(evicted.values())
+                self._design_craft_count -= len(evicted)
+            self.design_craft_metrics.append((time.time(), design_craft_scores))
+            self._design_craft_sum += sum(design_craft_scores.values())
+            self._design_craft_count += len(design_craft_scores)
     
     def check_for_alerts(self, system_health: SystemHealth, agent_metrics: Dict[str, AgentMetrics]) -> List[Dict[str, Any]]:
         """Check for system alerts based on thresholds."""
         alerts = []
         thresholds = self.config["alert_thresholds"]
-        
-        # System resource alerts
-        if system_health.cpu_usage > thresholds["cpu_usage"]:
-            alerts.append({
-                "type": "high_cpu_usage",
-                "severity": "warning",
-                "message": f"CPU usage at {system_health.cpu_usage:.1f}%",
-                "timestamp": time.time()
-            })
-        
-        if system_health.memory_usage > thresholds["memory_usage"]:
-            alerts.append({
-                "type": "high_memory_usage",
-                "severity": "warning",
-                "message": f"Memory usage at {system_health.memory_usage:.1f}%",
-                "timestamp": time.time()
-            })
-        
-        # Agent performance alerts
-        for agent_id, metrics in agent_metrics.items():
-            if metrics.response_time_ms > thresholds["agent_response_time"]:
+
+        # System resource and v11 quality alerts from the static rule table
+        for attr, exceeds, alert_type, severity, fmt in _ALERT_SPECS:
+            value = getattr(system_health, attr)
+            if exceeds(value, thresholds[attr]):
                 alerts.append({
-                    "type": "slow_agent_response",
-                    "severity": "warning",
-                    "message": f"Agent {agent_id} response time: {metrics.response_time_ms:.0f}ms",
+                    "type": alert_type,
+                    "severity": severity,
+                    "message": fmt.format(value),
                     "timestamp": time.time()
                 })
-        
-        # V11 specific alerts
-        if system_health.trust_calibration_quality < thresholds["trust_calibration_quality"]:
-            alerts.append({
-                "type": "low_trust_calibration",
-                "severity": "critical",
-                "message": f"Trust calibration quality at {system_health.trust_calibration_quality:.2f}",
-                "timestamp": time.time()
-            })
-        
-        if system_health.bias_detection_accuracy < thresholds["bias_detection_accuracy"]:
+
+        # Agent performance alerts: sweep the contiguous response-time
+        # column (one vectorized compare with numpy), then build alert
+        # dicts only for the rows that actually exceed the threshold
+        rt_threshold = thresholds["agent_response_time"]
+        rt_column = self._metric_columns["response_time_ms"]
+        if np is not None and rt_column:
+            slow_rows = np.nonzero(np.asarray(rt_column) > rt_threshold)[0].tolist()
+        else:
+            slow_rows = [i for i, rt in enumerate(rt_column) if rt > rt_threshold]
+        for row in slow_rows:
             alerts.append({
-                "type": "low_bias_detection",
-                "severity": "critical",
-                "message": f"Bias detection accuracy at {system_health.bias_detection_accuracy:.2f}",
+                "type": "slow_agent_response",
+                "severity": "warning",
+                "message": f"Agent {self._row_agents[row]} response time: {rt_column[row]:.0f}ms",
                 "timestamp": time.time()
             })
-        
+
         return alerts
     
     def generate_optimization_suggestions(self, system_health: SystemHealth, 
@@ -363,39 +573,103 @@ class FusionV11Monitor:
         """Calculate average trust calibration quality."""
         if not self.agent_metrics:
             return 0.85  # Default value
-        
-        trust_scores = [metrics.trust_score for metrics in self.agent_metrics.values()]
-        return sum(trust_scores) / len(trust_scores) if trust_scores else 0.85
+
+        return self._metric_sums["trust_score"] / len(self._agent_rows)
     
     def _calculate_average_bias_accuracy(self) -> float:
         """Calculate average bias detection accuracy."""
         if not self.agent_metrics:
             return 0.95  # Default value
-        
+
         # Bias score is inverted (lower is better), so accuracy is 1 - bias_score
-        bias_scores = [1 - metrics.bias_score for metrics in self.agent_metrics.values()]
-        return sum(bias_scores) / len(bias_scores) if bias_scores else 0.95
+        # mean(1 - b) == 1 - mean(b)
+        return 1 - self._metric_sums["bias_score"] / len(self._agent_rows)
     
+    @staticmethod
+    def _health_payload(system_health: SystemHealth):
+        """Snapshot payload without the recursive asdict copy.
+
+        The event line is serialized immediately, so aliasing
+        agent_performance (instead of deep-copying it) is safe.
+        """
+        if orjson is not None:
+            return system_health  # orjson serializes dataclasses natively
+        return {
+            "cpu_usage": system_health.cpu_usage,
+            "memory_usage": system_health.memory_usage,
+            "disk_usage": system_health.disk_usage,
+            "agent_performance": system_health.agent_performance,
+            "trust_calibration_quality": system_health.trust_calibration_quality,
+            "bias_detection_accuracy": system_health.bias_detection_accuracy,
+            "overall_health_score": system_health.overall_health_score,
+            "timestamp": system_health.timestamp
+        }
+
+    def _append_event(self, kind: str, payload: Any):
+        """Queue one compact JSON event line; flushed in batches."""
+        record = {"kind": kind, "data": payload}
+        if orjson is not None:
+            line = orjson.dumps(record) + b"\n"
+        else:
+            line = (json.dumps(record, separators=(",", ":")) + "\n").encode()
+        self._pending_events.append(line)
+        if (len(self._pending_events) >= EVENT_BATCH_SIZE
+                or time.monotonic() - self._last_event_flush > EVENT_FLUSH_SECONDS):
+            self._flush_events()
+
+    def _flush_events(self):
+        """Write all queued event lines in one vectored syscall."""
+        self._last_event_flush = time.monotonic()
+        if not self._pending_events:
+            return
+        bufs = list(self._pending_events)
+        self._pending_events.clear()
+        try:
+            if self._events_fd is None:
+                self._events_fd = os.open(
+                    self.events_file,
+                    os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                atexit.register(os.close, self._events_fd)
+            if hasattr(os, 'writev'):
+                os.writev(self._events_fd, bufs)
+            else:
+                os.write(self._events_fd, b"".join(bufs))
+        except Exception as e:
+            print(f"⚠️  Could not log monitoring events: {e}")
+
     def _save_data(self):
-        """Save monitoring data to file."""
+        """Save (compact) monitoring summary to file."""
         self.monitoring_data["last_update"] = time.time()
+        self._ticks_since_save = 0
         try:
-            with open(self.data_file, 'w') as f:
-                json.dump(self.monitoring_data, f, indent=2)
+            self._flush_events()
+            # Deques aren't JSON-serializable; shallow-copy them to lists
+            data = {
+                **self.monitoring_data,
+                "alerts": list(self.monitoring_data["alerts"]),
+                "improvements_suggested": list(self.monitoring_data["improvements_suggested"])
+            }
+            # Compact machine-read summary; orjson serializes straight to
+            # bytes, the stdlib path skips indent whitespace
+            if orjson is not None:
+                with open(self.data_file, 'wb') as f:
+                    f.write(orjson.dumps(data))
+            else:
+                with open(self.data_file, 'w') as f:
+                    json.dump(data, f, separators=(",", ":"))
         except Exception as e:
             print(f"⚠️  Could not save monitoring data: {e}")
     
     def generate_dashboard_report(self) -> Dict[str, Any]:
         """Generate comprehensive dashboard report."""
-        if not self.system_health_history:
+        latest_health = self._latest_health
+        if latest_health is None:
             return {"error": "No monitoring data available"}
-        
-        latest_health = self.system_health_history[-1]
-        
-        # Calculate trends
-        if len(self.system_health_history) >= 2:
-            previous_health = self.system_health_history[-2]
-            health_trend = latest_health.overall_health_score - previous_health.overall_health_score
+
+        # Calculate trends from the bounded score history
+        scores = self._health_score_history
+        if len(scores) >= 2:
+            health_trend = scores[-1] - scores[-2]
         else:
             health_trend = 0.0
         
@@ -424,53 +698,48 @@ class FusionV11Monitor:
                 "trust_calibration_quality": latest_health.trust_calibration_quality,
                 "bias_detection_accuracy": latest_health.bias_detection_accuracy
             },
-            "recent_alerts": self.monitoring_data["alerts"][-5:],  # Last 5 alerts
-            "optimization_suggestions": self.monitoring_data["improvements_suggested"][-3:]  # Last 3 suggestions
+            "recent_alerts": list(self.monitoring_data["alerts"])[-5:],  # Last 5 alerts
+            "optimization_suggestions": list(self.monitoring_data["improvements_suggested"])[-3:]  # Last 3 suggestions
         }
     
     def _calculate_average_response_time(self) -> float:
         """Calculate average response time across all agents."""
         if not self.agent_metrics:
             return 0.0
-        
-        response_times = [metrics.response_time_ms for metrics in self.agent_metrics.values()]
-        return sum(response_times) / len(response_times)
+
+        return self._metric_sums["response_time_ms"] / len(self._agent_rows)
     
     def _calculate_average_quality_score(self) -> float:
         """Calculate average quality score across all agents."""
         if not self.agent_metrics:
             return 0.0
-        
-        quality_scores = [metrics.quality_score for metrics in self.agent_metrics.values()]
-        return sum(quality_scores) / len(quality_scores)
+
+        return self._metric_sums["quality_score"] / len(self._agent_rows)
     
     def _get_top_performing_agents(self, count: int) -> List[Dict[str, Any]]:
         """Get top performing agents."""
         if not self.agent_metrics:
             return []
         
-        sorted_agents = sorted(self.agent_metrics.items(), 
-                             key=lambda x: x[1].quality_score, reverse=True)
-        
+        # O(N log k) partial selection instead of sorting all agents
+        top_agents = heapq.nlargest(count, self.agent_metrics.items(),
+                                    key=lambda x: x[1].quality_score)
+
         return [
             {
                 "agent_id": agent_id,
                 "quality_score": metrics.quality_score,
                 "response_time_ms": metrics.response_time_ms
             }
-            for agent_id, metrics in sorted_agents[:count]
+            for agent_id, metrics in top_agents
         ]
     
     def _calculate_average_design_craft(self) -> float:
         """Calculate average design craft score."""
-        if not self.design_craft_metrics:
+        if not self._design_craft_count:
             return 0.0
-        
-        all_scores = []
-        for timestamp, scores in self.design_craft_metrics.items():
-            all_scores.extend(scores.values())
-        
-        return sum(all_scores) / len(all_scores) if all_scores else 0.0
+
+        return self._design_craft_sum / self._design_craft_count
     
     def display_dashboard(self):
         """Display monitoring dashboard."""
@@ -480,59 +749,68 @@ class FusionV11Monitor:
             print(f"❌ {report['error']}")
             return
         
-        print("\n" + "="*70)
-        print("🚀 FUSION V11 MONITORING DASHBOARD")
-        print("="*70)
-        
+        from datetime import datetime
+
+        # Build the whole report in memory and emit it with one write
+        # instead of ~25 separate flushing print calls
+        out = []
+        append = out.append
+
+        append("\n" + "="*70)
+        append("🚀 FUSION V11 MONITORING DASHBOARD")
+        append("="*70)
+
         # System overview
         system = report["system_overview"]
-        print(f"\n📊 SYSTEM HEALTH: {system['overall_health_score']:.1%}")
-        print(f"   📈 Trend: {'+' if system['health_trend'] >= 0 else ''}{system['health_trend']:.2%}")
-        print(f"   🖥️  CPU: {system['cpu_usage']:.1f}%")
-        print(f"   🧠 Memory: {system['memory_usage']:.1f}%")
-        print(f"   💾 Disk: {system['disk_usage']:.1f}%")
-        
+        append(f"\n📊 SYSTEM HEALTH: {system['overall_health_score']:.1%}")
+        append(f"   📈 Trend: {'+' if system['health_trend'] >= 0 else ''}{system['health_trend']:.2%}")
+        append(f"   🖥️  CPU: {system['cpu_usage']:.1f}%")
+        append(f"   🧠 Memory: {system['memory_usage']:.1f}%")
+        append(f"   💾 Disk: {system['disk_usage']:.1f}%")
+
         # Agent performance
         agents = report["agent_performance"]
-        print(f"\n🤖 AGENT PERFORMANCE")
-        print(f"   🎯 Total Agents: {agents['total_agents']}")
-        print(f"   ⚡ Avg Response: {agents['average_response_time']:.0f}ms")
-        print(f"   📊 Avg Quality: {agents['average_quality_score']:.1%}")
-        
+        append(f"\n🤖 AGENT PERFORMANCE")
+        append(f"   🎯 Total Agents: {agents['total_agents']}")
+        append(f"   ⚡ Avg Response: {agents['average_response_time']:.0f}ms")
+        append(f"   📊 Avg Quality: {agents['average_quality_score']:.1%}")
+
         if agents["top_performing_agents"]:
-            print(f"   🏆 Top Performers:")
+            append(f"   🏆 Top Performers:")
             for agent in agents["top_performing_agents"]:
-                print(f"      • {agent['agent_id']}: {agent['quality_score']:.1%} ({agent['response_time_ms']:.0f}ms)")
-        
+                append(f"      • {agent['agent_id']}: {agent['quality_score']:.1%} ({agent['response_time_ms']:.0f}ms)")
+
         # V11 enhancements
         v11 = report["v11_enhancements"]
-        print(f"\n✨ V11 ENHANCEMENTS")
-        print(f"   🎭 Execution Modes: {v11['execution_modes_used']}")
-        print(f"   👤 Personality Overlays: {v11['personality_overlays_used']}")
-        print(f"   ⚖️  Creative Tensions: {v11['creative_tensions_analyzed']}")
-        print(f"   🎨 Design Craft Avg: {v11['design_craft_average']:.1%}")
-        
+        append(f"\n✨ V11 ENHANCEMENTS")
+        append(f"   🎭 Execution Modes: {v11['execution_modes_used']}")
+        append(f"   👤 Personality Overlays: {v11['personality_overlays_used']}")
+        append(f"   ⚖️  Creative Tensions: {v11['creative_tensions_analyzed']}")
+        append(f"   🎨 Design Craft Avg: {v11['design_craft_average']:.1%}")
+
         # Trust and bias
         trust = report["trust_and_bias"]
-        print(f"\n🛡️  TRUST & BIAS")
-        print(f"   🤝 Trust Calibration: {trust['trust_calibration_quality']:.1%}")
-        print(f"   🔍 Bias Detection: {trust['bias_detection_accuracy']:.1%}")
-        
+        append(f"\n🛡️  TRUST & BIAS")
+        append(f"   🤝 Trust Calibration: {trust['trust_calibration_quality']:.1%}")
+        append(f"   🔍 Bias Detection: {trust['bias_detection_accuracy']:.1%}")
+
         # Recent alerts
         if report["recent_alerts"]:
-            print(f"\n🚨 RECENT ALERTS")
+            append(f"\n🚨 RECENT ALERTS")
             for alert in report["recent_alerts"]:
                 severity_icon = "🔴" if alert["severity"] == "critical" else "🟡"
-                print(f"   {severity_icon} {alert['message']}")
-        
+                append(f"   {severity_icon} {alert['message']}")
+
         # Optimization suggestions
         if report["optimization_suggestions"]:
-            print(f"\n💡 OPTIMIZATION SUGGESTIONS")
+            append(f"\n💡 OPTIMIZATION SUGGESTIONS")
             for suggestion in report["optimization_suggestions"]:
                 priority_icon = "🔴" if suggestion["priority"] == "high" else "🟡" if suggestion["priority"] == "medium" else "🟢"
-                print(f"   {priority_icon} {suggestion['suggestion']}")
-        
-        print(f"\n⏰ Last updated: {datetime.fromtimestamp(system['timestamp']).strftime('%Y-%m-%d %H:%M:%S')}")
+                append(f"   {priority_icon} {suggestion['suggestion']}")
+
+        append(f"\n⏰ Last updated: {datetime.fromtimestamp(system['timestamp']).strftime('%Y-%m-%d %H:%M:%S')}")
+
+        sys.stdout.write("\n".join(out) + "\n")
 
 def main():
     """Main function for standalone monitoring."""
